@@ -1,18 +1,25 @@
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import csv
 import os
 import random
 import urllib.parse
 import time
-import math
-import pyautogui
+import numpy as np
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from chromedriver_utils import chromedriver_path
 from scraper import (
     get_random_background_search,
     random_delay,
@@ -23,10 +30,39 @@ from scraper import (
 # Load environment variables
 # dotenv.load_dotenv()
 
-def init_driver():
-    """Create and configure a Chrome WebDriver instance with enhanced anti-detection measures"""
+# Compiled patterns for issue links and DOIs on afajof.org pages
+_VOLUME_RE = re.compile(r'https://afajof\.org/issue/volume-(\d+)-issue-(\d+)/')
+# DOIs are matched against the raw HTML, so allow tags and &nbsp; between the label and the DOI
+_DOI_RE = re.compile(r'DOI:(?:\s|&nbsp;|<[^>]*>)*(\d+\.\d+/jofi\.\d+)')
+_VOLUME_PREFIX = 'https://afajof.org/issue/volume-'
+HTML_DIR = 'downloaded_html'
+_LINK_STRAINER = SoupStrainer('a', href=True)
+# Article title on a loaded paper, or the form on a Cloudflare challenge page
+_ARTICLE_READY_SELECTOR = 'h1.citation__title, #challenge-form'
+# Present in the HTML of a full article page, absent from login and challenge pages
+_ARTICLE_MARKER = 'citation__title'
+# Shown on afajof.org once the member login has completed
+_LOGGED_IN_SELECTOR = 'a[href*="logout"]'
+LOGIN_TIMEOUT = 60
+
+# Shared HTTP session so issue pages reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': random.choice(USER_AGENTS)})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+def init_driver(headless=False):
+    """
+    Create and configure a Chrome WebDriver instance with enhanced anti-detection measures.
+    Images and stylesheets are blocked since only the page HTML is saved.
+    
+    Args:
+        headless (bool): Run Chrome without a window. Leave off when logging in manually.
+    """
     options = webdriver.ChromeOptions()
     
+    if headless:
+        options.add_argument('--headless=new')
+    
     # Use a more specific and realistic user agent
     user_agent = random.choice(USER_AGENTS)
     options.add_argument(f'user-agent={user_agent}')
@@ -45,7 +81,8 @@ def init_driver():
         "credentials_enable_service": False,
         "profile.password_manager_enabled": False,
         "profile.default_content_setting_values.notifications": 2,
-        "profile.managed_default_content_settings.images": 1,
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
         "profile.default_content_setting_values.cookies": 1
     })
     
@@ -53,6 +90,9 @@ def init_driver():
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     
+    # Return from driver.get at DOMContentLoaded instead of waiting for every subresource
+    options.page_load_strategy = 'eager'
+    
     # Add common Chrome arguments
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--no-sandbox')
@@ -63,7 +103,7 @@ def init_driver():
     options.add_argument('--start-maximized')
     
     # Create WebDriver with enhanced options
-    driver = webdriver.Chrome(options=options)
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
     
     # Add additional JavaScript patches to avoid detection
     driver.execute_cdp_cmd('Network.setUserAgentOverride', {
@@ -96,7 +136,9 @@ def init_driver():
 
 def add_gentle_mouse_movement(driver):
     """
-    Move mouse in gentle circles near the center of the screen.
+    Move mouse in gentle circles near the center of the page.
+    Events are dispatched to the browser over CDP, so each driver moves its own
+    pointer without waiting on the physical mouse.
     """
     try:
         # Get window size
@@ -108,24 +150,52 @@ def add_gentle_mouse_movement(driver):
         radius = 100  # pixels
         num_points = random.randint(5, 10)
         
-        for i in range(num_points):
-            # Add some randomness to the circle
-            angle = (i / num_points) * 2 * math.pi
-            rand_radius = radius + random.randint(-20, 20)
-            x = center_x + int(rand_radius * math.cos(angle))
-            y = center_y + int(rand_radius * math.sin(angle))
-            
-            # Ensure coordinates are within screen bounds
-            x = max(0, min(x, window_size['width'] - 100))
-            y = max(0, min(y, window_size['height'] - 100))
-            
-            # Move mouse smoothly
-            pyautogui.moveTo(x, y, duration=0.5)
-            random_delay(0.1, 0.3)
+        # Compute all points on the circle at once, with some randomness in the radius
+        angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+        radii = radius + np.random.randint(-20, 21, num_points)
+        xs = center_x + (radii * np.cos(angles)).astype(int)
+        ys = center_y + (radii * np.sin(angles)).astype(int)
+        
+        # Ensure coordinates are within screen bounds
+        xs = np.clip(xs, 0, window_size['width'] - 100)
+        ys = np.clip(ys, 0, window_size['height'] - 100)
+        
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            # Move the page's mouse pointer directly
+            driver.execute_cdp_cmd('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': x, 'y': y})
+        
+        # Single short pause instead of one per point
+        random_delay(0.1, 0.3)
             
     except Exception as e:
         print(f"Error during mouse movement: {str(e)}")
 
+def parse_issue_link(href):
+    """
+    Extract the volume and issue numbers from an afajof.org issue link.
+    
+    Args:
+        href (str): Link of the form 'https://afajof.org/issue/volume-{volume}-issue-{issue}/'
+        
+    Returns:
+        tuple: (volume, issue) as integers, or None if the link is not an issue link
+    """
+    # Cheap prefix check rejects nearly every other link on the page
+    if not href.startswith(_VOLUME_PREFIX):
+        return None
+    
+    # Expect '{volume}-issue-{issue}/' after the prefix
+    segment, slash, _ = href[len(_VOLUME_PREFIX):].partition('/')
+    parts = segment.split('-')
+    if slash and len(parts) == 3 and parts[1] == 'issue' and parts[0].isdecimal() and parts[2].isdecimal():
+        return int(parts[0]), int(parts[2])
+    
+    # Fall back to the full pattern for anything irregular
+    match = _VOLUME_RE.match(href)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    return None
+
 def volume_scraper(url, output_file='volume_links.csv'):
     """
     Scrapes all links from a given URL that match the pattern 'https://afajof.org/issue/volume-{volume}-issue-{issue}/'
@@ -136,13 +206,11 @@ def volume_scraper(url, output_file='volume_links.csv'):
         output_file (str): The name of the CSV file to write results to
     """
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=20)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        links = soup.find_all('a', href=True)
-        
-        pattern = r'https://afajof\.org/issue/volume-(\d+)-issue-(\d+)/'
+        # Only build <a href> elements; the rest of the page is never needed
+        links = BeautifulSoup(response.text, 'lxml', parse_only=_LINK_STRAINER).find_all('a', href=True)
         
         with open(output_file, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
@@ -150,10 +218,9 @@ def volume_scraper(url, output_file='volume_links.csv'):
             
             for link in links:
                 href = link['href']
-                match = re.match(pattern, href)
-                if match:
-                    volume = int(match.group(1))
-                    issue = int(match.group(2))
+                parsed = parse_issue_link(href)
+                if parsed:
+                    volume, issue = parsed
                     writer.writerow([volume, issue, href])
         
         print(f"Results written to {output_file}")
@@ -163,70 +230,125 @@ def volume_scraper(url, output_file='volume_links.csv'):
     except Exception as e:
         print(f"An error occurred: {e}")
 
-def doi_scraper(url, output_file='doi_links.csv'):
+def doi_scraper(url):
     """
-    Scrapes DOIs from a given URL that match the pattern 'integer.integer/jofi.integer'
-    and appends the results to a CSV file.
+    Scrapes DOIs from a given URL that match the pattern 'integer.integer/jofi.integer'.
     
     Args:
         url (str): The URL to scrape from
-        output_file (str): The name of the CSV file to append results to
+        
+    Returns:
+        list: [doi, url] rows for each DOI found, empty if the page could not be fetched
     """
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=20)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Pattern to match DOIs in the format integer.integer/jofi.integer
-        pattern = r'DOI:\s*(\d+\.\d+/jofi\.\d+)'
-        
-        # Find all text in the HTML
-        text = soup.get_text()
-        
-        # Find all DOI matches
-        matches = re.finditer(pattern, text)
-        
-        # Open file in append mode
-        with open(output_file, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header if file is empty
-            if csvfile.tell() == 0:
-                writer.writerow(['DOI', 'Source URL'])
-            
-            # Write each DOI found
-            for match in matches:
-                doi = match.group(1)
-                writer.writerow([doi, url])
-        
-        print(f"DOIs appended to {output_file}")
+        # Scan the raw HTML directly rather than building a DOM just to get its text
+        rows = [[match.group(1), url] for match in _DOI_RE.finditer(response.text)]
+        print(f"Found {len(rows)} DOIs on {url}")
+        return rows
         
     except requests.RequestException as e:
         print(f"Error fetching URL: {e}")
     except Exception as e:
         print(f"An error occurred: {e}")
+    return []
+
+def issues_doi_scraper(issue_csv='issue_links.csv', output_file='dois.csv', max_workers=16):
+    """
+    Scrapes DOIs from every issue page listed in a CSV file and appends them to a CSV file.
+    Issue pages are fetched concurrently; rows are written from the calling thread only.
+    
+    Args:
+        issue_csv (str): CSV file written by volume_scraper, with a 'URL' column
+        output_file (str): The name of the CSV file to append results to
+        max_workers (int): Number of issue pages fetched in parallel
+    """
+    with open(issue_csv, 'r', buffering=1 << 16) as csvfile:
+        issue_urls = [row['URL'] for row in csv.DictReader(csvfile)]
+    
+    # Decide on the header once, before the file is opened for appending
+    write_header = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+    
+    with open(output_file, 'a', newline='', buffering=1 << 20) as doi_file:
+        writer = csv.writer(doi_file)
+        if write_header:
+            writer.writerow(['DOI', 'Source URL'])
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(doi_scraper, url) for url in issue_urls]
+            for future in as_completed(futures):
+                writer.writerows(future.result())
+    
+    print(f"DOIs appended to {output_file}")
+
+def html_filename(doi):
+    """Return the file name (without directory) used to store the HTML for a DOI."""
+    # Replace '/' with '-' in DOI for filename
+    return f"{doi.replace('/', '-')}.html"
+
+def session_from_driver(driver):
+    """
+    Build a requests session that carries a logged-in driver's cookies and user agent.
+    Cookies for every domain are read in one CDP call; if that fails, WebDriver's
+    get_cookies() is used, which only returns cookies for the current page's domain.
+    
+    Args:
+        driver (webdriver.Chrome): Chrome WebDriver that has completed the member login
+        
+    Returns:
+        requests.Session: Session authenticated as the driver's user
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': driver.execute_script("return navigator.userAgent")})
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    try:
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+    except Exception:
+        cookies = driver.get_cookies()
+    for cookie in cookies:
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+    return session
 
-def metadata_scraper(doi, driver=None):
+def metadata_scraper(doi, driver=None, session=None):
     """
     Scrapes metadata from a JF article page using the DOI.
     Downloads the HTML content if not already present in downloaded_html.
+    When a logged-in session is given the page is fetched over plain HTTP first,
+    and the browser is only used if that does not return the article.
     
     Args:
         doi (str): The DOI of the article
         driver (webdriver.Chrome, optional): Existing Chrome WebDriver instance
+        session (requests.Session, optional): Session built with session_from_driver
     """
     # Create downloaded_html directory if it doesn't exist
-    os.makedirs('downloaded_html', exist_ok=True)
+    os.makedirs(HTML_DIR, exist_ok=True)
     
-    # Replace '/' with '-' in DOI for filename
-    filename = f"downloaded_html/{doi.replace('/', '-')}.html"
+    filename = os.path.join(HTML_DIR, html_filename(doi))
     
     # Skip if file already exists
     if os.path.exists(filename):
         print(f"File already exists for DOI: {doi}")
         return
     
+    # Construct the JF article URL
+    url = f"https://afajof.org/viewarticle.php?url=full/{doi}"
+    
+    # Try the cheap HTTP fetch before driving the browser
+    if session is not None:
+        try:
+            response = session.get(url, timeout=20)
+            if response.status_code == 200 and _ARTICLE_MARKER in response.text:
+                with open(filename, 'wb', buffering=1 << 20) as f:
+                    f.write(response.content)
+                print(f"Successfully downloaded HTML for DOI: {doi}")
+                return
+            print(f"HTTP fetch did not return the article for DOI {doi}, using browser")
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for DOI {doi}: {e}, using browser")
+    
     # Initialize driver if not provided
     should_quit = False
     if driver is None:
@@ -234,10 +356,16 @@ def metadata_scraper(doi, driver=None):
         should_quit = True
     
     try:
-        # Construct and visit the JF article URL
-        url = f"https://afajof.org/viewarticle.php?url=full/{doi}"
+        # Visit the JF article URL
         driver.get(url)
-        random_delay(2, 3)  # Shorter delay after page load
+        
+        # Wait until the article (or a challenge page) is in the DOM
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _ARTICLE_READY_SELECTOR))
+            )
+        except TimeoutException:
+            time.sleep(1)
         
         # Check for Cloudflare captcha
         if is_cloudflare_captcha(driver):
@@ -247,9 +375,9 @@ def metadata_scraper(doi, driver=None):
         # Add gentle mouse movement
         add_gentle_mouse_movement(driver)
         
-        # Save the page content
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
+        # Save the page content, encoding once instead of through a text wrapper
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(driver.page_source.encode('utf-8', 'replace'))
         print(f"Successfully downloaded HTML for DOI: {doi}")
         
     except Exception as e:
@@ -258,53 +386,133 @@ def metadata_scraper(doi, driver=None):
         if should_quit:
             driver.quit()
 
-def process_dois_from_csv(csv_path='dois.csv', max_papers=None):
+def _decoy_searches(driver, num_searches=2):
+    """
+    Run a few decoy Google Scholar searches so the browser looks less automated.
+    
+    Args:
+        driver (webdriver.Chrome): Chrome WebDriver to search with
+        num_searches (int): Number of searches to run
+    """
+    for _ in range(num_searches):
+        search_term = get_random_background_search()
+        driver.get(f"https://scholar.google.com/scholar?q={urllib.parse.quote(search_term)}")
+        random_delay(2, 4)  # Shorter delay for decoy searches
+        add_gentle_mouse_movement(driver)
+        random_delay(1, 2)
+
+def _doi_worker(driver, session, doi_queue, progress, lock):
+    """
+    Download HTML for DOIs pulled from a shared queue until it is empty.
+    Each worker does its own decoy searches first, so they run in parallel across drivers.
+    
+    Args:
+        driver (webdriver.Chrome): Logged-in Chrome WebDriver owned by this worker
+        session (requests.Session): Session sharing the driver's login cookies
+        doi_queue (queue.Queue): Queue of DOIs shared between workers
+        progress (list): Single-element list holding the shared processed count
+        lock (threading.Lock): Lock guarding the shared progress count
+    """
+    _decoy_searches(driver)
+    
+    while True:
+        try:
+            doi = doi_queue.get_nowait()
+        except queue.Empty:
+            return
+        
+        with lock:
+            progress[0] += 1
+            print(f"Processing DOI {progress[0]}: {doi}")
+        metadata_scraper(doi, driver=driver, session=session)
+        
+        # Keep a polite per-worker delay between papers (10-15 seconds)
+        delay = random.uniform(10, 15)
+        print(f"Waiting {delay:.1f} seconds before next DOI...")
+        time.sleep(delay)
+
+def process_dois_from_csv(csv_path='dois.csv', max_papers=None, num_workers=4):
     """
     Process DOIs from a CSV file and download their HTML content.
     
     Args:
         csv_path (str): Path to CSV file containing DOIs
         max_papers (int, optional): Maximum number of papers to process
+        num_workers (int): Number of Chrome instances downloading in parallel
     """
-    driver = init_driver()
+    # Skip DOIs that were downloaded on a previous run before any browser starts
+    os.makedirs(HTML_DIR, exist_ok=True)
+    done = set(os.listdir(HTML_DIR))
+    
+    doi_queue = queue.Queue()
+    skipped = 0
+    with open(csv_path, 'r', buffering=1 << 16) as csvfile:
+        reader = csv.DictReader(csvfile)
+        for i, row in enumerate(reader):
+            if max_papers and i >= max_papers:
+                break
+            doi = row['DOI']
+            if html_filename(doi) in done:
+                skipped += 1
+                continue
+            doi_queue.put(doi)
+    
+    print(f"Skipping {skipped} already downloaded DOIs, {doi_queue.qsize()} remaining")
+    if doi_queue.empty():
+        return
+    
+    drivers = []
     try:
-        # Navigate to login page and wait for manual login
-        driver.get("https://afajof.org/member-login/")
-        print("Please log in manually. You have 10 seconds...")
-        time.sleep(10)
+        for _ in range(max(1, min(num_workers, doi_queue.qsize()))):
+            drivers.append(init_driver())
+        
+        # Navigate each browser to the login page and wait for manual login
+        for driver in drivers:
+            driver.get("https://afajof.org/member-login/")
+        print(f"Please log in manually in all {len(drivers)} windows. You have {LOGIN_TIMEOUT} seconds...")
+        
+        # Continue as soon as every window shows a logout link, sharing one deadline
+        deadline = time.monotonic() + LOGIN_TIMEOUT
+        for n, driver in enumerate(drivers, 1):
+            try:
+                WebDriverWait(driver, max(1, deadline - time.monotonic())).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _LOGGED_IN_SELECTOR))
+                )
+            except TimeoutException:
+                print(f"Login not detected in window {n}, continuing anyway")
         print("Continuing with scraping...")
         
-        # Do two decoy Google Scholar searches at the start
-        for _ in range(2):
-            search_term = get_random_background_search()
-            driver.get(f"https://scholar.google.com/scholar?q={urllib.parse.quote(search_term)}")
-            random_delay(2, 4)  # Shorter delay for decoy searches
-            add_gentle_mouse_movement(driver)
-            random_delay(1, 2)
+        # Copy login cookies before the decoy searches navigate away
+        sessions = [session_from_driver(driver) for driver in drivers]
         
-        with open(csv_path, 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for i, row in enumerate(reader):
-                if max_papers and i >= max_papers:
-                    break
-                    
-                doi = row['DOI']
-                print(f"Processing DOI {i+1}: {doi}")
-                metadata_scraper(doi, driver=driver)
-                
-                # Add consistent delay between papers (10-15 seconds)
-                delay = random.uniform(10, 15)
-                print(f"Waiting {delay:.1f} seconds before next DOI...")
-                time.sleep(delay)
+        progress = [0]
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            futures = [executor.submit(_doi_worker, driver, session, doi_queue, progress, lock)
+                       for driver, session in zip(drivers, sessions)]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Worker failed: {str(e)}")
                 
     finally:
-        driver.quit()
-
-# volume_scraper("https://afajof.org/issue-archive/", output_file='issue_links.csv')
-# with open('issue_links.csv', 'r') as csvfile:
-#     reader = csv.DictReader(csvfile)
-#     for row in reader:
-#         issue_url = row['URL']
-#         doi_scraper(issue_url, output_file='dois.csv')
+        for driver in drivers:
+            driver.quit()
 
-process_dois_from_csv('dois.csv')
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Journal of Finance issues, DOIs and article HTML from afajof.org")
+    parser.add_argument('command', nargs='?', default='download', choices=['issues', 'dois', 'download'],
+                        help="issues: collect issue links; dois: collect DOIs from issue pages; download: save article HTML")
+    parser.add_argument('--issue-csv', default='issue_links.csv', help="CSV file of issue links")
+    parser.add_argument('--doi-csv', default='dois.csv', help="CSV file of DOIs")
+    parser.add_argument('--max-papers', type=int, default=None, help="Maximum number of papers to download")
+    parser.add_argument('--workers', type=int, default=4, help="Number of parallel workers")
+    args = parser.parse_args()
+    
+    if args.command == 'issues':
+        volume_scraper("https://afajof.org/issue-archive/", output_file=args.issue_csv)
+    elif args.command == 'dois':
+        issues_doi_scraper(args.issue_csv, output_file=args.doi_csv, max_workers=args.workers)
+    else:
+        process_dois_from_csv(args.doi_csv, max_papers=args.max_papers, num_workers=args.workers)
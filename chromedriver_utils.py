@@ -0,0 +1,23 @@
+import functools
+import os
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+# chromedriver.exe shipped with the repo; it is a Windows binary pinned to one Chrome version
+BUNDLED_CHROMEDRIVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chromedriver.exe')
+
+# Explicitly chosen chromedriver binary, used as-is on any OS
+CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+
+@functools.lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    """
+    Resolve the chromedriver binary once per process, so each driver in a pool starts without a lookup.
+    Uses CHROMEDRIVER_PATH when set, the bundled chromedriver.exe on Windows, and otherwise
+    webdriver_manager, which downloads a driver matching the installed Chrome.
+    """
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+    if os.name == 'nt' and os.path.exists(BUNDLED_CHROMEDRIVER):
+        return BUNDLED_CHROMEDRIVER
+    return ChromeDriverManager().install()
@@ -5,8 +5,8 @@ import os
 def txt_to_csv(txt_file, output_path):
     with open(txt_file, 'r', encoding='utf-8', errors='replace') as infile, open(output_path, 'w', newline='', encoding='utf-8') as outfile:
         writer = csv.writer(outfile)
-        for line in infile:
-            writer.writerow([line.strip()])
+        # Titles can contain commas, so keep csv quoting but let writerows drive the loop
+        writer.writerows([line.strip()] for line in infile)
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
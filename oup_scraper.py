@@ -1,14 +1,122 @@
 import requests
-from bs4 import BeautifulSoup
-from typing import List
-import re
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from typing import Iterator, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def article_link_collector(url: str) -> List[str]:
+# Issue links are .../issue/<volume>/<issue>, article links .../article/<volume>/<issue>/<page>/<id>
+_ISSUE_PREFIX = 'https://academic.oup.com/rfs/issue/'
+_ARTICLE_PREFIX = 'https://academic.oup.com/rfs/article/'
+
+def _has_numeric_path(href: str, prefix: str, segments: int) -> bool:
+    """
+    Checks that href starts with prefix followed by the given number of numeric path segments.
+    
+    The last segment only has to start with a digit, so query strings and trailing
+    path parts are allowed after it. Uses string operations instead of a regex per anchor.
+    """
+    if not href.startswith(prefix):
+        return False
+    parts = href[len(prefix):].split('/', segments - 1)
+    return (len(parts) == segments
+            and all(part.isdecimal() for part in parts[:-1])
+            and parts[-1][:1].isdecimal())
+
+def is_issue_link(href: str) -> bool:
+    """Returns True for links to an OUP issue page."""
+    return _has_numeric_path(href, _ISSUE_PREFIX, 2)
+
+def is_article_link(href: str) -> bool:
+    """Returns True for links to an OUP article page."""
+    return _has_numeric_path(href, _ARTICLE_PREFIX, 4)
+
+# Issue pages fetched concurrently; the connection pool is sized to match
+ISSUE_FETCH_WORKERS = 16
+
+# Shared session so the archive and issue fetches reuse keep-alive connections to OUP
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate'
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=ISSUE_FETCH_WORKERS, max_retries=3))
+
+# Size of the body chunks fed to the pull parser while a page downloads
+STREAM_CHUNK_SIZE = 16384
+
+def _free_processed(element):
+    """Deletes the nodes before a finished element, at its own level and at each ancestor's."""
+    node = element
+    parent = node.getparent()
+    while parent is not None:
+        while node.getprevious() is not None:
+            del parent[0]
+        node, parent = parent, parent.getparent()
+
+def _read_anchor_hrefs(parser):
+    """Yields hrefs from the anchors the pull parser has finished, freeing the tree read so far."""
+    for _, element in parser.read_events():
+        href = element.get('href')
+        if href:
+            yield href
+        element.clear()
+        _free_processed(element)
+
+def page_links(response: requests.Response) -> Iterator[str]:
+    """
+    Yields the href of every anchor in a streamed HTML response.
+    
+    The body is fed to the parser in chunks as it arrives. Once an anchor is
+    read it is cleared and everything parsed before it is deleted, so the tree
+    holds roughly the open elements and anything after the last anchor
+    rather than the whole page.
+    Hrefs come straight from lxml's elements and are filtered by the caller
+    as they are produced, so no intermediate list is built.
+    
+    Args:
+        response (requests.Response): Response opened with stream=True
+        
+    Yields:
+        str: Anchor hrefs in document order
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    head = b''
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        if head is not None:
+            # libxml2's push parser can crash when a feed ends inside the DOCTYPE,
+            # so the start of the page is held back until its first '>' arrives
+            head += chunk
+            if b'>' not in head:
+                continue
+            chunk, head = head, None
+        parser.feed(chunk)
+        yield from _read_anchor_hrefs(parser)
+    if head:
+        parser.feed(head)
+    parser.close()
+    yield from _read_anchor_hrefs(parser)
+
+def issue_article_links(issue_link: str) -> List[str]:
+    """
+    Fetches one OUP issue page and returns the article links on it.
+    
+    Args:
+        issue_link (str): URL of the form "https://academic.oup.com/rfs/issue/*/*"
+        
+    Returns:
+        List[str]: List of article URLs
+    """
+    with _SESSION.get(issue_link, timeout=30, stream=True) as issue_response:
+        issue_response.raise_for_status()
+        return list(filter(is_article_link, page_links(issue_response)))
+
+def article_link_collector(url: str, max_workers: int = ISSUE_FETCH_WORKERS) -> List[str]:
     """
     Collects article links from OUP archive pages.
     
     Args:
         url (str): URL of the form "https://academic.oup.com/rfs/issue-archive/*"
+        max_workers (int): Number of issue pages fetched concurrently
         
     Returns:
         List[str]: List of article URLs
@@ -17,37 +125,33 @@ def article_link_collector(url: str) -> List[str]:
     
     try:
         # Get the archive page
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with _SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Find all issue links
+            issue_links = set(filter(is_issue_link, page_links(response)))
         
-        # Find all issue links
-        issue_pattern = r'https://academic\.oup\.com/rfs/issue/\d+/\d+'
-        issue_links = {a.get('href') for a in soup.find_all('a', href=True)
-                      if re.match(issue_pattern, a.get('href'))}
-        
-        # Visit each issue page and collect article links
-        for issue_link in issue_links:
-            try:
-                issue_response = requests.get(issue_link)
-                issue_response.raise_for_status()
-                issue_soup = BeautifulSoup(issue_response.text, 'html.parser')
-                
-                # Find article links
-                article_pattern = r'https://academic\.oup\.com/rfs/article/\d+/\d+/\d+/\d+'
-                article_links.update(
-                    a.get('href') for a in issue_soup.find_all('a', href=True)
-                    if re.match(article_pattern, a.get('href'))
-                )
-            except requests.RequestException as e:
-                print(f"Error accessing issue page {issue_link}: {e}")
-                continue
+        # Fetch the issue pages in parallel and collect article links as they arrive
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(issue_article_links, issue_link): issue_link
+                       for issue_link in issue_links}
+            for future in as_completed(futures):
+                try:
+                    article_links.update(future.result())
+                except requests.RequestException as e:
+                    print(f"Error accessing issue page {futures[future]}: {e}")
+                except (etree.LxmlError, ValueError) as e:
+                    # A malformed or empty page only loses that issue's links
+                    print(f"Error parsing issue page {futures[future]}: {e}")
                 
         return list(article_links)
         
     except requests.RequestException as e:
         print(f"Error accessing archive page {url}: {e}")
         return []
+    except (etree.LxmlError, ValueError) as e:
+        print(f"Error parsing archive page {url}: {e}")
+        return []
 
 if __name__ == "__main__":
     url = "https://academic.oup.com/rfs/issue-archive/2025"
@@ -0,0 +1,36 @@
+import pytest
+
+import chromedriver_utils
+
+
+class _FakeManager:
+    def install(self):
+        return "/downloaded/chromedriver"
+
+
+@pytest.fixture(autouse=True)
+def fresh_resolver(monkeypatch):
+    """Clear the memoized path and stub out webdriver_manager's download"""
+    chromedriver_utils.chromedriver_path.cache_clear()
+    monkeypatch.setattr(chromedriver_utils, "ChromeDriverManager", _FakeManager)
+    monkeypatch.setattr(chromedriver_utils, "CHROMEDRIVER_PATH", None)
+    yield
+    chromedriver_utils.chromedriver_path.cache_clear()
+
+
+def test_explicit_path_wins(monkeypatch):
+    monkeypatch.setattr(chromedriver_utils, "CHROMEDRIVER_PATH", "/opt/chromedriver")
+    assert chromedriver_utils.chromedriver_path() == "/opt/chromedriver"
+
+
+def test_bundled_binary_only_on_windows(monkeypatch, tmp_path):
+    bundled = tmp_path / "chromedriver.exe"
+    bundled.write_bytes(b"")
+    monkeypatch.setattr(chromedriver_utils, "BUNDLED_CHROMEDRIVER", str(bundled))
+
+    monkeypatch.setattr(chromedriver_utils.os, "name", "posix")
+    assert chromedriver_utils.chromedriver_path() == "/downloaded/chromedriver"
+
+    chromedriver_utils.chromedriver_path.cache_clear()
+    monkeypatch.setattr(chromedriver_utils.os, "name", "nt")
+    assert chromedriver_utils.chromedriver_path() == str(bundled)
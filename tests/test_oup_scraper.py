@@ -0,0 +1,78 @@
+import lxml.html
+import pytest
+from lxml import etree
+
+import oup_scraper
+
+
+# Anchors at several depths, with unclosed tags and text around them; small chunks split the DOCTYPE
+ISSUE_PAGE = (
+    b'<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" '
+    b'"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+    b'<html><head><title>Issue</title></head><body><div class="toc">'
+    + b''.join(
+        b'<section><h3>Section %d</h3><ul><li><a href="https://academic.oup.com/rfs/article/38/1/%d/7654321">'
+        b'Title <i>%d</i></a> tail<li><p>Abstract <a href="/rel/%d">pdf</a></ul></section>' % (i, i, i, i)
+        for i in range(50)
+    )
+    + b'<a>no href</a></div><p>footer</body></html>'
+)
+
+
+class _ChunkedResponse:
+    def __init__(self, body, size):
+        self.body = body
+        self.size = size
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), self.size):
+            yield self.body[start:start + self.size]
+
+
+@pytest.mark.parametrize("size", [7, 64, 4096])
+def test_page_links_match_a_full_parse(size):
+    expected = [a.get("href") for a in lxml.html.fromstring(ISSUE_PAGE).iter("a") if a.get("href")]
+
+    assert list(oup_scraper.page_links(_ChunkedResponse(ISSUE_PAGE, size))) == expected
+
+
+class _ArchiveResponse:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield b""
+
+
+def test_empty_archive_page_returns_no_links(monkeypatch):
+    monkeypatch.setattr(oup_scraper._SESSION, "get", lambda *args, **kwargs: _ArchiveResponse())
+
+    links = oup_scraper.article_link_collector("https://academic.oup.com/rfs/issue-archive/2025")
+
+    assert links == []
+
+
+def test_bad_issue_page_is_skipped(monkeypatch):
+    issue_links = [
+        "https://academic.oup.com/rfs/issue/38/1",
+        "https://academic.oup.com/rfs/issue/38/2",
+    ]
+
+    def issue_article_links(issue_link):
+        if issue_link.endswith("/1"):
+            raise etree.XMLSyntaxError("Document is empty", 0, 0, 0)
+        return ["https://academic.oup.com/rfs/article/38/2/1/7654321"]
+
+    monkeypatch.setattr(oup_scraper._SESSION, "get", lambda *args, **kwargs: _ArchiveResponse())
+    monkeypatch.setattr(oup_scraper, "page_links", lambda response: iter(issue_links))
+    monkeypatch.setattr(oup_scraper, "issue_article_links", issue_article_links)
+
+    links = oup_scraper.article_link_collector("https://academic.oup.com/rfs/issue-archive/2025")
+
+    assert links == ["https://academic.oup.com/rfs/article/38/2/1/7654321"]
@@ -0,0 +1,61 @@
+import random
+import re
+import time
+
+import pytest
+
+import wiley_html_parser
+
+# The single pattern working_paper_title replaced; the function must pick the same title
+OLD_WORKING_PAPER_TITLE_RE = re.compile(
+    r',\s*([^,]*?(?:\([^)]*\)[^,]*?)*)(?:\s*,\s*Working\s+paper)', re.IGNORECASE
+)
+
+
+def old_working_paper_title(text):
+    match = OLD_WORKING_PAPER_TITLE_RE.search(text)
+    return match.group(1) if match else None
+
+
+@pytest.mark.parametrize("text", [
+    # Shapes seen after the year in Wiley working-paper references
+    ", Asset pricing with liquidity risk, Working paper, Harvard University.",
+    ", Asset pricing with liquidity risk, Working Paper, NBER.",
+    ",  Momentum and reversal ,  working  paper, Yale University",
+    ", The (un)reliability of betas, Working paper, MIT.",
+    ", Prices (and quantities, too), Working paper, Stanford University.",
+    ", Returns (1926-2000), a (long, long) history, Working paper",
+    "a, Title, (Note, b), Working paper",
+    ", Title (unclosed, Working paper",
+    ", Title), Working paper",
+    ", Discussion paper, Some University.",
+    ", No institution given, working paper",
+    "",
+    ", , Working paper",
+    ", A, B, C, Working paper, X, Working paper",
+    ", (a, b), Working paper (x), Working paper",
+])
+def test_working_paper_title_matches_old_regex(text):
+    assert wiley_html_parser.working_paper_title(text) == old_working_paper_title(text)
+
+
+def test_working_paper_title_matches_old_regex_on_random_text():
+    rng = random.Random(0)
+    pieces = [",", " ", "(", ")", "a", "b", ", Working paper", " ,Working  Paper",
+              "working paper", "x y", "\t", "(a, b)", ")("]
+    for _ in range(20000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 14)))
+        assert wiley_html_parser.working_paper_title(text) == old_working_paper_title(text), repr(text)
+
+
+def test_working_paper_title_pathological_input():
+    # The old pattern backtracks exponentially on "(...)" groups with no "Working paper" after
+    # them: 22 groups took seconds and each extra group doubled it
+    small = ", " + "(a)" * 12 + " x"
+    assert wiley_html_parser.working_paper_title(small) == old_working_paper_title(small) is None
+
+    large = ", " + "(a)" * 3000 + " x"
+    start = time.perf_counter()
+    assert wiley_html_parser.working_paper_title(large) is None
+    assert wiley_html_parser.working_paper_title(large + ", y, Working paper") == "y"
+    assert time.perf_counter() - start < 1
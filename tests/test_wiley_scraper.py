@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+import wiley_scraper
+
+
+@pytest.fixture
+def result_cache_file(tmp_path, monkeypatch):
+    """Point the Scholar result cache at a fresh file and drop anything already loaded"""
+    cache_file = tmp_path / "scholar_results.cache"
+    monkeypatch.setattr(wiley_scraper, "RESULT_CACHE_FILE", str(cache_file))
+    monkeypatch.setattr(wiley_scraper, "_result_cache", None)
+    return cache_file
+
+
+def test_result_cache_miss_store_hit(result_cache_file):
+    key = wiley_scraper.result_cache_key("Some Paper", "wiley", "the journal of finance")
+
+    assert wiley_scraper.get_cached_result(key) is None
+
+    wiley_scraper.cache_result(key, "https://onlinelibrary.wiley.com/doi/10.1111/jofi.1", "10.1111/jofi.1")
+
+    expected = {"url": "https://onlinelibrary.wiley.com/doi/10.1111/jofi.1", "doi": "10.1111/jofi.1"}
+    assert wiley_scraper.get_cached_result(key) == expected
+    assert json.loads(result_cache_file.read_text(encoding="utf-8")) == {key: expected}
+
+
+def test_result_cache_loads_from_disk(result_cache_file):
+    key = wiley_scraper.result_cache_key("Other Paper", "jstor")
+    result_cache_file.write_text(json.dumps({key: {"url": "u", "doi": "d"}}), encoding="utf-8")
+
+    assert wiley_scraper.get_cached_result(key) == {"url": "u", "doi": "d"}
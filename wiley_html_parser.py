@@ -1,15 +1,73 @@
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from enum import Enum
 import re
+import functools
 from datetime import datetime
 import os
 import json
+import gzip
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
-import pandas as pd
+
+# Compiled once here rather than looked up in re's cache on every reference
+_WHITESPACE_RE = re.compile(r'\s+')
+# Punctuation trimmed from both ends of cleaned text (whitespace is collapsed to spaces first)
+_EDGE_PUNCT = ' .,;:'
+# Tail rules match where the unwanted tail starts; _cut_at drops everything from there on.
+# Matching only the start avoids running '.*$' over the rest of the string for every match.
+_JOURNAL_AUTHOR_TAIL_RE = re.compile(r',\s*[A-Z][a-z]+')
+_JOURNAL_NAME_TAIL_RE = re.compile(r'\s*[A-Z][a-z]+\s+[A-Z][a-z]+')
+# Plain words, so clean_journal looks for them with str.find rather than the regex engine
+_JOURNAL_WORDS = ('Journal', 'Proceedings', 'Conference', 'Transactions')
+_NUMBER_TAIL_RE = re.compile(r'\s*\d')
+_YEAR_TAIL_RE = re.compile(r'\s*\d{4}')
+# Each tail rule is paired with a word its match must contain, so _cut_at_each can rule it
+# out with a substring test instead of a regex search; '' means always search
+_JOURNAL_WORD_TAIL_RULES = (
+    ('Journal', re.compile(r'\s*Journal\s')),
+    ('Proceedings', re.compile(r'\s*Proceedings\s')),
+    ('Conference', re.compile(r'\s*Conference\s')),
+)
+# A tail rule below can only fire if its word (or a year) occurs, so one search for any of
+# them lets the common case skip the individual passes
+_MIXED_CONTENT_WORD_RE = re.compile(r'(?:using|with|based\s+on|for|in)\s')
+_AUTHOR_TAIL_WORD_RE = re.compile(r'\d{4}|(?:Journal|Proceedings|Conference|using|with|based\s+on|for|in)\s')
+_MIXED_CONTENT_TAIL_RULES = (
+    ('using', re.compile(r'\s*using\s')),
+    ('with', re.compile(r'\s*with\s')),
+    ('based', re.compile(r'\s*based\s+on\s')),
+    ('for', re.compile(r'\s*for\s')),
+    ('in', re.compile(r'\s*in\s')),
+)
+# The year rule comes first; clean_authors applies these in this order
+_AUTHOR_TAIL_RULES = (('', _YEAR_TAIL_RE),) + _JOURNAL_WORD_TAIL_RULES + _MIXED_CONTENT_TAIL_RULES
+_YEAR_RE = re.compile(r'(19|20)\d{2}')
+# Digits and brackets dropped from author names; str.translate removes the ASCII ones in one
+# pass, and the regex catches digits from other scripts
+_NAME_NOISE_TABLE = str.maketrans('', '', '0123456789[]()')
+_NAME_NOISE_RE = re.compile(r'[\d\[\]\(\)]')
+_SINGLE_INITIAL_RE = re.compile(r'\s+[A-Z]\s+')
+_WORKING_PAPER_RE = re.compile(r'working\s+paper', re.IGNORECASE)
+_WORKING_PAPER_TITLE_START_RE = re.compile(r',\s*')
+_WORKING_PAPER_TITLE_END_RE = re.compile(r'\s*,\s*Working\s+paper', re.IGNORECASE)
+_WORKING_PAPER_INSTITUTION_RE = re.compile(r'working\s+paper\s*,\s*([^.]+?)(?:\.|$)', re.IGNORECASE)
+_INSTITUTION_RE = re.compile(r'([^,]+(?:University|Institute|College|School)[^,]*)')
+_VOLUME_LABEL_RE = re.compile(r'(?:Vol\.|Volume)\s*(\d+)')
+_VOLUME_NUMBER_RE = re.compile(r'(\d+)\s*[,.]')
+_LABELLED_PAGE_RANGE_RE = re.compile(r'(?:pp?\.\s*)?(\d+)\s*[-–]\s*(\d+)')
+_PAGE_RANGE_RE = re.compile(r'(\d+)\s*[-–]\s*(\d+)')
+_VOLUME_ISSUE_RE = re.compile(r'Volume\s+(\d+),\s*Issue\s+(\d+)')
+_ARTICLE_PAGE_RANGE_RE = re.compile(r'p\.\s*(\d+)-(\d+)')
+_CITATIONS_RE = re.compile(r'(\d+)')
+
+# Size of the memo caches on the text cleaners; the same author names and journals recur
+# across references and papers
+CLEAN_CACHE_SIZE = 8192
 
 class ReferenceType(Enum):
     ARTICLE = "article"
@@ -19,7 +77,7 @@ class ReferenceType(Enum):
     def __str__(self):
         return self.value
 
-@dataclass
+@dataclass(slots=True)
 class Reference:
     authors: List[str]
     year: Optional[str]
@@ -34,7 +92,7 @@ class Reference:
     book_title: Optional[str] = None
     chapter_title: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ArticleMetadata:
     title: Optional[str]
     authors: List[str]
@@ -47,18 +105,32 @@ class ArticleMetadata:
     doi: Optional[str]
     references: List[Reference]
 
+def _cut_at(tail_re: re.Pattern, text: str) -> str:
+    """Remove everything from the first match of tail_re onwards."""
+    match = tail_re.search(text)
+    return text[:match.start()] if match else text
+
+def _cut_at_each(tail_rules: Tuple[Tuple[str, re.Pattern], ...], text: str) -> str:
+    """Apply _cut_at for each (word, tail_re) rule in turn, each on what the previous ones left."""
+    for word, tail_re in tail_rules:
+        # Most rules' words don't occur at all, which a substring test settles far faster
+        if word in text:
+            text = _cut_at(tail_re, text)
+    return text
+
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_text(text: str) -> str:
     """Clean text by removing extra whitespace and normalizing characters."""
     if not text:
         return ""
-    # Replace any weird whitespace characters with a single space
-    text = re.sub(r'\s+', ' ', text)
-    # Remove any trailing punctuation except for closing parentheses
-    text = re.sub(r'[.,;:\s]+$', '', text)
-    # Remove any leading whitespace or punctuation
-    text = re.sub(r'^[.,;:\s]+', '', text)
-    return text.strip()
+    # Replace any weird whitespace characters with a single space. Every whitespace character
+    # other than the plain space is non-printable, so most text can skip the regex entirely.
+    if not text.isprintable() or '  ' in text:
+        text = _WHITESPACE_RE.sub(' ', text)
+    # Remove leading and trailing punctuation (except for closing parentheses)
+    return text.strip(_EDGE_PUNCT)
 
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_journal(text: str) -> str:
     """Clean journal title by removing any mixed content"""
     if not text:
@@ -68,32 +140,31 @@ def clean_journal(text: str) -> str:
     text = clean_text(text)
     
     # Remove any text after author names
-    text = re.sub(r',\s*[A-Z][a-z]+.*$', '', text)
-    text = re.sub(r'\s*[A-Z][a-z]+\s+[A-Z][a-z]+.*$', '', text)
+    text = _cut_at(_JOURNAL_AUTHOR_TAIL_RE, text)
+    text = _cut_at(_JOURNAL_NAME_TAIL_RE, text)
     
     # Remove any text after common journal words if they appear twice
-    journal_words = ['Journal', 'Proceedings', 'Conference', 'Transactions']
-    for word in journal_words:
-        matches = list(re.finditer(word, text))
-        if len(matches) > 1:
-            text = text[:matches[1].start()].strip()
+    for word in _JOURNAL_WORDS:
+        first = text.find(word)
+        if first != -1:
+            second = text.find(word, first + len(word))
+            if second != -1:
+                text = text[:second].strip()
             
     # If the text starts with a bracket, it's probably not a journal
     if text.startswith('['):
         return ""
         
     # Remove any text after numbers
-    text = re.sub(r'\s*\d+.*$', '', text)
+    text = _cut_at(_NUMBER_TAIL_RE, text)
     
     # Remove any text after common words that indicate mixed content
-    text = re.sub(r'\s*using\s+.*$', '', text)
-    text = re.sub(r'\s*with\s+.*$', '', text)
-    text = re.sub(r'\s*based\s+on\s+.*$', '', text)
-    text = re.sub(r'\s*for\s+.*$', '', text)
-    text = re.sub(r'\s*in\s+.*$', '', text)
+    if _MIXED_CONTENT_WORD_RE.search(text):
+        text = _cut_at_each(_MIXED_CONTENT_TAIL_RULES, text)
     
     return text.strip()
 
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_authors(text: str) -> str:
     """Clean author text by removing any mixed content"""
     if not text:
@@ -102,66 +173,113 @@ def clean_authors(text: str) -> str:
     # First clean with standard function
     text = clean_text(text)
     
-    # Remove any text after a year pattern
-    text = re.sub(r'\s*\d{4}.*$', '', text)
-    
-    # Remove any text after common journal words
-    text = re.sub(r'\s*Journal\s+.*$', '', text)
-    text = re.sub(r'\s*Proceedings\s+.*$', '', text)
-    text = re.sub(r'\s*Conference\s+.*$', '', text)
+    # Most author names contain none of the words below, so check for any of them once
+    if not _AUTHOR_TAIL_WORD_RE.search(text):
+        return text
     
-    # Remove any text after common words that indicate mixed content
-    text = re.sub(r'\s*using\s+.*$', '', text)
-    text = re.sub(r'\s*with\s+.*$', '', text)
-    text = re.sub(r'\s*based\s+on\s+.*$', '', text)
-    text = re.sub(r'\s*for\s+.*$', '', text)
-    text = re.sub(r'\s*in\s+.*$', '', text)
+    # Remove any text after a year pattern, then after common journal words, then after common
+    # words that indicate mixed content
+    text = _cut_at_each(_AUTHOR_TAIL_RULES, text)
     
     return text.strip()
 
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def extract_year(text: str) -> str:
     """Extract a valid year from text"""
     if not text:
         return ""
-    match = re.search(r'(19|20)\d{2}', text)
+    match = _YEAR_RE.search(text)
     if match:
         return match.group(0)
     return ""
 
+def _first_number(text: str) -> str:
+    """Return the first run of digits in text, or "" if there is none"""
+    # Short inputs like "123" or "e123", so a plain scan beats setting up a regex search
+    n = len(text)
+    start = 0
+    while start < n and not text[start].isdecimal():
+        start += 1
+    end = start
+    while end < n and text[end].isdecimal():
+        end += 1
+    return text[start:end]
+
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_pages(text: str) -> str:
     """Clean page numbers by removing any mixed content"""
     if not text:
         return ""
     # Extract just the first set of numbers, ignoring anything after
-    match = re.search(r'\d+', text)
-    if match:
-        return match.group(0)
-    return ""
+    return _first_number(text)
 
+@functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_volume(text: str) -> str:
     """Clean volume number by removing any mixed content"""
     if not text:
         return ""
     # Extract just the first set of numbers
-    match = re.search(r'\d+', text)
-    if match:
-        return match.group(1)
-    return ""
+    return _first_number(text)
 
 def split_name(name: str) -> str:
     """Split and clean an author name"""
     # Remove any numbers, brackets and extra punctuation
-    name = re.sub(r'[\d\[\]\(\)]', '', name)
+    name = name.translate(_NAME_NOISE_TABLE)
+    if not name.isascii():
+        name = _NAME_NOISE_RE.sub('', name)
     # Remove any single letters (likely initials without dots)
-    name = re.sub(r'\s+[A-Z]\s+', ' ', name)
+    name = _SINGLE_INITIAL_RE.sub(' ', name)
     return clean_text(name)
 
+def working_paper_title(text: str) -> Optional[str]:
+    """
+    Find a working paper's title: the text after a comma and before ", Working paper", where
+    commas may only appear inside parentheses
+    Args:
+        text: Reference text following the year
+    Returns:
+        The raw title text, or None if there is none
+    """
+    # This used to be the single pattern
+    #   ,\s*([^,]*?(?:\([^)]*\)[^,]*?)*)(?:\s*,\s*Working\s+paper)
+    # which backtracks exponentially on a run of "(...)" groups not followed by "Working paper".
+    # The search below tries the same alternatives in the same order, so it returns the same
+    # match, but it remembers every position it has ruled out. Whether a title can continue
+    # from a position never depends on how the search got there, so each one is tried once.
+    failed = set()
+    for start in _WORKING_PAPER_TITLE_START_RE.finditer(text):
+        # Each frame is [segment start, scan position, "(...)" branch already tried]. A segment
+        # is a comma-free stretch, optionally followed by a "(...)" group and another segment.
+        stack = [[start.end(), start.end(), False]]
+        while stack:
+            frame = stack[-1]
+            i, j, tried_group = frame
+            if not tried_group:
+                if j in failed:
+                    failed.update(range(i, j))
+                    stack.pop()
+                    continue
+                if _WORKING_PAPER_TITLE_END_RE.match(text, j):
+                    return text[start.end():j]
+                frame[2] = True
+                if j < len(text) and text[j] == '(':
+                    close = text.find(')', j + 1)
+                    if close != -1:
+                        stack.append([close + 1, close + 1, False])
+                        continue
+            if j == len(text) or text[j] == ',':
+                failed.update(range(i, j + 1))
+                stack.pop()
+            else:
+                frame[1] = j + 1
+                frame[2] = False
+    return None
+
 def parse_date(date_str: str) -> Optional[str]:
     """Convert date from '07 November 2003' format to datetime string"""
     if not date_str:
         return None
     try:
-        from datetime import datetime
         # Parse the date string
         date_obj = datetime.strptime(date_str.strip(), "%d %B %Y")
         # Convert to ISO format
@@ -169,11 +287,99 @@ def parse_date(date_str: str) -> Optional[str]:
     except Exception:
         return None
 
-def parse_reference(ref_elem) -> Reference:
+def _text(elem) -> str:
+    """All the text inside elem, like text_content() but without the XPath call for plain leaves"""
+    # Author, year and title elements rarely have children, so their text is just .text
+    if len(elem) == 0:
+        return elem.text or ''
+    return elem.text_content()
+
+def _has_class(elem, cls: str) -> bool:
+    """Whether one of elem's classes, or its whole class attribute, is cls"""
+    classes = elem.get('class')
+    return bool(classes) and (cls in classes.split() or ' '.join(classes.split()) == cls)
+
+def _find(root, tag: Optional[str], cls: str):
+    """First descendant of root with the given tag (any tag if None) and class, or None"""
+    return next(_find_all(root, tag, cls), None)
+
+def _find_all(root, tag: Optional[str], cls: str) -> Iterator:
+    """Descendants of root with the given tag (any tag if None) and class, in document order"""
+    return (elem for elem in root.iterdescendants(tag) if _has_class(elem, cls))
+
+# The tags and '.class' keys parse_reference and reference_doi look up; nothing else is indexed
+_REFERENCE_INDEX_TAGS = frozenset(['a', 'i', 'em'])
+_REFERENCE_INDEX_CLASSES = frozenset([
+    '.author', '.pubYear', '.chapterTitle', '.bookTitle', '.otherTitle', '.articleTitle',
+    '.extra-links getFTR',
+])
+
+def index_reference(ref_elem) -> Dict[str, list]:
+    """
+    Index the descendants of a reference element in a single traversal
+    Args:
+        ref_elem: lxml element containing the reference
+    Returns:
+        Dict mapping the tag names and '.' + class (or full multi-class) values that the
+        reference parser uses to the matching elements in document order; <i> and <em> are
+        also collected under 'italic'
+    """
+    index = {}
+    for elem in ref_elem.iterdescendants():
+        tag = elem.tag
+        if tag in _REFERENCE_INDEX_TAGS:
+            index.setdefault(tag, []).append(elem)
+            if tag != 'a':
+                index.setdefault('italic', []).append(elem)
+        classes = elem.get('class')
+        if classes:
+            classes = classes.split()
+            keys = {'.' + cls for cls in classes}
+            if len(classes) > 1:
+                keys.add('.' + ' '.join(classes))
+            for key in keys & _REFERENCE_INDEX_CLASSES:
+                index.setdefault(key, []).append(elem)
+    return index
+
+def _first(index: Dict[str, list], key: str):
+    """First element indexed under key, or None"""
+    elems = index.get(key)
+    return elems[0] if elems else None
+
+def reference_doi(index: Dict[str, list]) -> Optional[str]:
+    """
+    Find the DOI of a reference, stopping at the first method that yields one
+    Args:
+        index: Descendants of the reference element from index_reference
+    Returns:
+        DOI string if found, None otherwise
+    """
+    # First try to find DOI in hidden span with data-doi class
+    doi_container = next((elem for elem in index.get('.extra-links getFTR', []) if elem.tag == 'div'), None)
+    if doi_container is not None:
+        doi_span = _find(doi_container, 'span', 'hidden data-doi')
+        if doi_span is not None:
+            # Get the text directly from the span's first text node
+            for text in doi_span.itertext():
+                text = text.strip()
+                if text.startswith('10.'):
+                    return text
+    
+    # Fallback to looking for DOI in href if not found in span
+    for elem in index.get('a', []):
+        doi_href = elem.get('href')
+        if doi_href and 'doi.org' in doi_href:
+            if doi_href.startswith('https://doi.org/'):
+                return doi_href[len('https://doi.org/'):]
+            return doi_href
+    return None
+
+def parse_reference(ref_elem, index: Optional[Dict[str, list]] = None) -> Reference:
     """
     Parse a reference from its HTML element using specific class names
     Args:
-        ref_elem: BeautifulSoup element containing the reference
+        ref_elem: lxml element containing the reference
+        index: index_reference(ref_elem), if the caller has already built it
     Returns:
         Reference object containing parsed components
     """
@@ -183,166 +389,160 @@ def parse_reference(ref_elem) -> Reference:
         ref_type=ReferenceType.ARTICLE
     )
     
-    try:
-        # Extract authors from class='author'
-        author_elems = ref_elem.find_all(class_='author')
-        authors = []
-        for author in author_elems:
-            author_text = clean_authors(author.get_text())
-            if author_text and len(author_text) > 2:  # Ignore very short author names
-                # Remove any leading/trailing commas
-                author_text = author_text.strip(',')
-                if author_text:
-                    authors.append(author_text)
-        ref.authors = authors
-        
-        # Extract year from class='pubYear'
-        year_elem = ref_elem.find(class_='pubYear')
-        if year_elem:
-            ref.year = extract_year(year_elem.get_text())
+    # Walk the reference once and look elements up by class or tag from here on
+    if index is None:
+        index = index_reference(ref_elem)
+    
+    # Extract authors from class='author'
+    author_elems = index.get('.author', [])
+    authors = []
+    for author in author_elems:
+        author_text = clean_authors(_text(author))
+        if author_text and len(author_text) > 2:  # Ignore very short author names
+            # Remove any leading/trailing commas
+            author_text = author_text.strip(',')
+            if author_text:
+                authors.append(author_text)
+    ref.authors = authors
+    
+    # Extract year from class='pubYear'
+    year_elem = _first(index, '.pubYear')
+    year_text = _text(year_elem) if year_elem is not None else None
+    if year_elem is not None:
+        ref.year = extract_year(year_text)
+    
+    # Title elements; the book title is cleaned once for both the book branch and book_title
+    chapter_elem = _first(index, '.chapterTitle')
+    book_elem = _first(index, '.bookTitle')
+    other_elem = _first(index, '.otherTitle')
+    book_title = clean_text(_text(book_elem)) if book_elem is not None else None
+    
+    # Determine reference type; the full text is reused for volume and pages below
+    full_text = ref_elem.text_content()
+    
+    # 1. Check for working paper; most references never mention one, so a plain substring
+    # check rules them out before the regex runs
+    if 'working' in full_text.lower() and _WORKING_PAPER_RE.search(full_text):
+        ref.ref_type = ReferenceType.WORKING_PAPER
         
-        # Determine reference type
-        full_text = ref_elem.get_text()
+        # Extract title for working paper - it's between the year and "Working paper"
+        if year_elem is not None:
+            # Get text after the year up to "Working paper"
+            after_year = full_text[full_text.find(year_text) + len(year_text):]
+            title = working_paper_title(after_year)
+            if title is not None:
+                ref.title = clean_text(title)
         
-        # 1. Check for working paper
-        if re.search(r'working\s+paper', full_text, re.IGNORECASE):
-            ref.ref_type = ReferenceType.WORKING_PAPER
-            
-            # Extract title for working paper - it's between the year and "Working paper"
-            year_elem = ref_elem.find(class_='pubYear')
-            if year_elem:
-                # Get text after the year up to "Working paper"
-                after_year = full_text[full_text.find(year_elem.get_text()) + len(year_elem.get_text()):]
-                title_match = re.search(r',\s*([^,]*?(?:\([^)]*\)[^,]*?)*)(?:\s*,\s*Working\s+paper)', after_year, re.IGNORECASE)
-                if title_match:
-                    ref.title = clean_text(title_match.group(1))
-            
-            # Extract working paper institution
-            # Look for text after "Working paper" or "Working Paper"
-            match = re.search(r'working\s+paper\s*,\s*([^.]+?)(?:\.|$)', full_text, re.IGNORECASE)
-            if match:
-                ref.working_paper_institution = match.group(1).strip()
-        
-        # 2. Check for journal (has italicized title)
-        elif ref_elem.find('i'):
-            ref.ref_type = ReferenceType.ARTICLE
-            # Extract title from articleTitle class for journal articles
-            article_elem = ref_elem.find(class_='articleTitle')
-            if article_elem:
-                ref.title = clean_text(article_elem.get_text())
-            
-            # Extract journal name from italicized text
-            italic_elems = ref_elem.find_all(['i', 'em'])
-            if italic_elems:
-                # Get the text from all italic elements
-                journal_text = ' '.join(clean_text(elem.get_text()) for elem in italic_elems if elem.get_text().strip())
-                if journal_text:
-                    ref.journal = journal_text
+        # Extract working paper institution
+        # Look for text after "Working paper" or "Working Paper"
+        match = _WORKING_PAPER_INSTITUTION_RE.search(full_text)
+        if match:
+            ref.working_paper_institution = match.group(1).strip()
+    
+    # 2. Check for journal (has italicized title)
+    elif 'i' in index:
+        ref.ref_type = ReferenceType.ARTICLE
+        # Extract title from articleTitle class for journal articles
+        article_elem = _first(index, '.articleTitle')
+        if article_elem is not None:
+            ref.title = clean_text(_text(article_elem))
         
-        # 3. Otherwise it's a book
-        else:
-            ref.ref_type = ReferenceType.BOOK
-            # Extract title from bookTitle class for books
-            book_elem = ref_elem.find(class_='bookTitle')
-            if book_elem:
-                ref.title = clean_text(book_elem.get_text())
+        # Extract journal name from italicized text
+        italic_elems = index['italic']
+        if italic_elems:
+            # Get the text from all italic elements
+            italic_texts = (_text(elem) for elem in italic_elems)
+            journal_text = ' '.join(clean_text(text) for text in italic_texts if text.strip())
+            if journal_text:
+                ref.journal = journal_text
+    
+    # 3. Otherwise it's a book
+    else:
+        ref.ref_type = ReferenceType.BOOK
+        # Extract title from bookTitle class for books
+        if book_elem is not None:
+            ref.title = book_title
 
-        # Extract title
-        chapter_elem = ref_elem.find(class_='chapterTitle')
-        book_elem = ref_elem.find(class_='bookTitle')
-        other_elem = ref_elem.find(class_='otherTitle')
-        
-        # Check for book first
-        if chapter_elem or book_elem:
-            if chapter_elem:
-                ref.chapter_title = clean_text(chapter_elem.get_text())
-            if book_elem:
-                ref.book_title = clean_text(book_elem.get_text())
-        
-        # Check for other title
-        elif other_elem:
-            ref.title = clean_text(other_elem.get_text())
-            # Check if this might be a working paper
-            text_lower = ref.title.lower()
-            if 'working paper' in text_lower or 'discussion paper' in text_lower:
-                ref.ref_type = ReferenceType.WORKING_PAPER
-                # Try to extract institution
-                inst_match = re.search(r'([^,]+(?:University|Institute|College|School)[^,]*)', ref.title)
-                if inst_match:
-                    ref.working_paper_institution = inst_match.group(1).strip()
-        
-        # Extract volume and pages if it's a journal article
-        if ref.ref_type == ReferenceType.ARTICLE:
-            # Get the full text of the reference
-            full_text = ref_elem.get_text()
+    # Extract title
+    # Check for book first
+    if chapter_elem is not None or book_elem is not None:
+        if chapter_elem is not None:
+            ref.chapter_title = clean_text(_text(chapter_elem))
+        if book_elem is not None:
+            ref.book_title = book_title
+    
+    # Check for other title
+    elif other_elem is not None:
+        ref.title = clean_text(_text(other_elem))
+        # Check if this might be a working paper
+        text_lower = ref.title.lower()
+        if 'working paper' in text_lower or 'discussion paper' in text_lower:
+            ref.ref_type = ReferenceType.WORKING_PAPER
+            # Try to extract institution
+            inst_match = _INSTITUTION_RE.search(ref.title)
+            if inst_match:
+                ref.working_paper_institution = inst_match.group(1).strip()
+    
+    # Extract volume and pages if it's a journal article
+    # (an article whose italic elements are all blank has no journal to anchor on)
+    if ref.ref_type == ReferenceType.ARTICLE and ref.journal:
+        # Find the journal in the full text and look at what comes after
+        journal_idx = full_text.find(ref.journal)
+        if journal_idx != -1:
+            after_journal = full_text[journal_idx + len(ref.journal):].strip()
             
-            # Find the journal in the full text and look at what comes after
-            journal_idx = full_text.find(ref.journal)
-            if journal_idx != -1:
-                after_journal = full_text[journal_idx + len(ref.journal):].strip()
-                
-                # Try different patterns for volume and pages
-                # Pattern 1: "Vol. X" or "Volume X" followed by pages
-                vol_match = re.search(r'(?:Vol\.|Volume)\s*(\d+)', after_journal)
+            # Try different patterns for volume and pages
+            # Pattern 1: "Vol. X" or "Volume X" followed by pages
+            vol_match = _VOLUME_LABEL_RE.search(after_journal)
+            if vol_match:
+                ref.volume = vol_match.group(1)
+                # Look for pages after the volume
+                page_text = after_journal[vol_match.end():]
+            else:
+                # Pattern 2: Just a number followed by comma and pages
+                vol_match = _VOLUME_NUMBER_RE.search(after_journal)
                 if vol_match:
                     ref.volume = vol_match.group(1)
-                    # Look for pages after the volume
                     page_text = after_journal[vol_match.end():]
                 else:
-                    # Pattern 2: Just a number followed by comma and pages
-                    vol_match = re.search(r'(\d+)\s*[,.]', after_journal)
-                    if vol_match:
-                        ref.volume = vol_match.group(1)
-                        page_text = after_journal[vol_match.end():]
-                    else:
-                        page_text = after_journal
-                
-                # Look for page numbers in various formats
-                # Format 1: pp. 123-145 or p. 123-145
-                page_match = re.search(r'(?:pp?\.\s*)?(\d+)\s*[-–]\s*(\d+)', page_text)
+                    page_text = after_journal
+            
+            # Look for page numbers in various formats
+            # Format 1: pp. 123-145 or p. 123-145
+            page_match = _LABELLED_PAGE_RANGE_RE.search(page_text)
+            if page_match:
+                ref.page_first = page_match.group(1)
+                ref.page_last = page_match.group(2)
+            else:
+                # Format 2: Just numbers separated by hyphen
+                page_match = _PAGE_RANGE_RE.search(page_text)
                 if page_match:
                     ref.page_first = page_match.group(1)
                     ref.page_last = page_match.group(2)
-                else:
-                    # Format 2: Just numbers separated by hyphen
-                    page_match = re.search(r'(\d+)\s*[-–]\s*(\d+)', page_text)
-                    if page_match:
-                        ref.page_first = page_match.group(1)
-                        ref.page_last = page_match.group(2)
-                
-                if ref.volume or ref.page_first:
-                    pass
-        
-        # Extract DOI if present
-        # First try to find DOI in hidden span with data-doi class
-        doi_container = ref_elem.find('div', class_='extra-links getFTR')
-        if doi_container:
-            doi_span = doi_container.find('span', class_='hidden data-doi')
-            if doi_span:
-                # Get the text directly from the span's first text node
-                for text in doi_span.stripped_strings:
-                    if text.startswith('10.'):
-                        ref.doi = text
-                        break
-        
-        # Fallback to looking for DOI in href if not found in span
-        if not ref.doi:
-            doi_elem = ref_elem.find('a', href=re.compile(r'doi.org'))
-            if doi_elem:
-                doi_href = doi_elem['href']
-                if doi_href.startswith('https://doi.org/'):
-                    ref.doi = doi_href[len('https://doi.org/'):]
-                else:
-                    ref.doi = doi_href
-        
-        if ref.doi:
-            pass
-        
-        return ref
-        
-    except Exception as e:
-        print(f"Error parsing reference: {str(e)}")
-        return ref
+            
+            if ref.volume or ref.page_first:
+                pass
+    
+    # Extract DOI if present
+    ref.doi = reference_doi(index)
+    
+    return ref
+
+def _is_removable_link(tag) -> bool:
+    """Match the links and buttons to strip from references; DOI links are kept"""
+    return tag.tag in ('a', 'button') and 'doi.org' not in (tag.get('href') or '')
+
+def _author_name(author_elem) -> Optional[str]:
+    """Raw name of an article author from its span, title attribute or text, in that order"""
+    span = next(author_elem.iterdescendants('span'), None)
+    if span is not None:
+        return span.text_content()
+    if author_elem.get('title'):
+        return author_elem.get('title')
+    return author_elem.text_content()
+
+# Comments are dropped while parsing so element text never includes them
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', remove_comments=True)
 
 def parse_wiley_html(file_path: str) -> ArticleMetadata:
     """
@@ -353,48 +553,39 @@ def parse_wiley_html(file_path: str) -> ArticleMetadata:
         ArticleMetadata object containing the paper's metadata and references
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, 'html.parser')
+        # Pages saved with COMPRESS_HTML are gzip-compressed
+        opener = gzip.open if file_path.endswith('.gz') else open
+        with opener(file_path, 'rb') as f:
+            # The tree stays in lxml's C structures; only the elements read below become
+            # Python objects
+            root = lxml.html.parse(f, _HTML_PARSER).getroot()
+        # Script and style contents aren't page text
+        etree.strip_elements(root, 'script', 'style', with_tail=False)
         
         # Extract title
         title = None
-        title_elem = soup.find('h1', class_='citation__title')
-        if title_elem:
-            title = title_elem.get_text().strip()
-        
-        # Extract authors (using set to remove duplicates)
-        authors = []
-        seen_authors = set()
+        title_elem = _find(root, 'h1', 'citation__title')
+        if title_elem is not None:
+            title = title_elem.text_content().strip()
         
+        # Extract authors
         # Try finding authors in accordion tabs
-        author_elems = soup.find_all('a', class_='author-name')
+        author_elems = list(_find_all(root, 'a', 'author-name'))
         if not author_elems:  # Try alternative author elements
-            author_elems = soup.find_all('div', class_='author-info')
+            author_elems = list(_find_all(root, 'div', 'author-info'))
         
-        for author_elem in author_elems:
-            name = None
-            # Try different ways to get author name
-            if author_elem.find('span'):
-                name = author_elem.find('span').text
-            elif author_elem.get('title'):
-                name = author_elem['title']
-            else:
-                name = author_elem.text
-                
-            if name:
-                name = clean_text(name)
-                if name not in seen_authors:
-                    authors.append(name)
-                    seen_authors.add(name)
+        # dict.fromkeys drops repeated names and keeps the first-seen order
+        names = (_author_name(author_elem) for author_elem in author_elems)
+        authors = list(dict.fromkeys(clean_text(name) for name in names if name))
         
         # Extract volume and issue from volume-issue class
         volume = None
         issue = None
-        volume_issue_elem = soup.find('a', class_='volume-issue')
-        if volume_issue_elem:
-            volume_text = volume_issue_elem.text
+        volume_issue_elem = _find(root, 'a', 'volume-issue')
+        if volume_issue_elem is not None:
+            volume_text = volume_issue_elem.text_content()
             # Match "Volume X, Issue Y" format
-            match = re.match(r'Volume\s+(\d+),\s*Issue\s+(\d+)', volume_text)
+            match = _VOLUME_ISSUE_RE.match(volume_text)
             if match:
                 volume = match.group(1)
                 issue = match.group(2)
@@ -402,21 +593,21 @@ def parse_wiley_html(file_path: str) -> ArticleMetadata:
         # Extract page numbers from citation__page-range class
         page_first = None
         page_last = None
-        pages_elem = soup.find('span', class_='citation__page-range')
-        if pages_elem:
-            pages_text = pages_elem.text
+        pages_elem = _find(root, 'span', 'citation__page-range')
+        if pages_elem is not None:
+            pages_text = pages_elem.text_content()
             # Match "p. X-Y" format
-            match = re.search(r'p\.\s*(\d+)-(\d+)', pages_text)
+            match = _ARTICLE_PAGE_RANGE_RE.search(pages_text)
             if match:
                 page_first = match.group(1)
                 page_last = match.group(2)
         
         # Extract publication date
-        date_elem = soup.find('span', class_='epub-date')
-        if date_elem:
+        date_elem = _find(root, 'span', 'epub-date')
+        if date_elem is not None:
             try:
                 # Parse date text like "First published: 03 December 2003"
-                date_text = date_elem.get_text().strip()
+                date_text = date_elem.text_content().strip()
                 if 'First published:' in date_text:
                     date_text = date_text.split('First published:')[1].strip()
                 published_date = datetime.strptime(date_text, '%d %B %Y').date()
@@ -427,32 +618,42 @@ def parse_wiley_html(file_path: str) -> ArticleMetadata:
         
         # Extract citation count from citedby-section link
         citations = None
-        citations_elem = soup.find('a', href='#citedby-section')
-        if citations_elem:
-            citations_text = citations_elem.text
-            citations_match = re.search(r'(\d+)', citations_text)
+        citations_elem = next((elem for elem in root.iter('a') if elem.get('href') == '#citedby-section'), None)
+        if citations_elem is not None:
+            citations_text = citations_elem.text_content()
+            citations_match = _CITATIONS_RE.search(citations_text)
             if citations_match:
                 citations = int(citations_match.group(1))
         
         # Extract DOI from epub-doi class
         doi = None
-        doi_elem = soup.find('a', class_='epub-doi')
-        if doi_elem:
+        doi_elem = _find(root, 'a', 'epub-doi')
+        if doi_elem is not None:
             doi_href = doi_elem.get('href')
             if doi_href and doi_href.startswith('https://doi.org/'):
                 doi = doi_href[len('https://doi.org/'):]
         
         # Extract references
         references = []
-        ref_list = soup.find('ul', class_='rlist separator')
-        if ref_list:
-            for ref_item in ref_list.find_all('li'):
-                # Remove any citation links or web elements before parsing
-                for elem in ref_item.find_all(['a', 'button']):
-                    if not (elem.get('href') and 'doi.org' in elem['href']):
-                        elem.decompose()
-                
-                ref = parse_reference(ref_item)
+        ref_list = _find(root, 'ul', 'rlist separator')
+        if ref_list is not None:
+            # Remove any citation links or web elements before parsing, in one walk over the list;
+            # drop_tree keeps the text that follows each one
+            for elem in list(ref_list.iterdescendants('a', 'button')):
+                if _is_removable_link(elem):
+                    elem.drop_tree()
+            
+            for ref_item in ref_list.iterdescendants('li'):
+                # References without any author are dropped below, so don't parse them at all
+                index = index_reference(ref_item)
+                if '.author' not in index:
+                    continue
+                # One malformed reference shouldn't lose the rest of the list
+                try:
+                    ref = parse_reference(ref_item, index)
+                except Exception as e:
+                    print(f"Error parsing reference: {str(e)}")
+                    continue
                 if ref.authors:  # Only add if we found at least one author
                     references.append(ref)
         
@@ -484,7 +685,60 @@ def parse_wiley_html(file_path: str) -> ArticleMetadata:
             references=[]
         )
 
-def process_html_files(html_dir: str, output_file_json: str, output_file_csv: str) -> List[dict]:
+def iter_parse_wiley_html(file_paths: List[str], max_workers: Optional[int] = None) -> Iterator[ArticleMetadata]:
+    """
+    Parse many Wiley HTML files in parallel worker processes, yielding results as they're ready
+    
+    Args:
+        file_paths: Paths to the HTML files
+        max_workers: Number of worker processes (defaults to the number of CPUs)
+    
+    Returns:
+        Iterator of ArticleMetadata for each file, in the same order as file_paths
+    """
+    # Parsing is CPU-bound, so use processes rather than threads; chunks of files amortize the IPC
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(parse_wiley_html, file_paths, chunksize=8)
+
+def parse_wiley_html_batch(file_paths: List[str], max_workers: Optional[int] = None) -> List[ArticleMetadata]:
+    """
+    Parse many Wiley HTML files in parallel worker processes
+    
+    Args:
+        file_paths: Paths to the HTML files
+        max_workers: Number of worker processes (defaults to the number of CPUs)
+    
+    Returns:
+        ArticleMetadata for each file, in the same order as file_paths
+    """
+    return list(iter_parse_wiley_html(file_paths, max_workers))
+
+def write_json_array_item(f, item: dict, first: bool) -> None:
+    """
+    Append one element to a JSON array being written a piece at a time; the caller closes the
+    array with a newline and ']' (or writes '[]' if there were no elements)
+    
+    Args:
+        f: Text file the array is written to
+        item: Element to write
+        first: Whether this is the array's first element (writes the opening bracket)
+    """
+    # Laid out exactly as json.dump(items, f, ensure_ascii=False, indent=2) would
+    text = json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+    f.write(('[\n  ' if first else ',\n  ') + text)
+
+# Columns of the CSV written by process_html_files: one row per reference, with its article's fields
+CSV_FIELDS = [
+    'article.title', 'article.authors', 'article.published_date', 'article.volume',
+    'article.issue', 'article.page_first', 'article.page_last', 'article.citations',
+    'article.doi', 'reference.ref_type', 'reference.authors', 'reference.year',
+    'reference.title', 'reference.journal', 'reference.volume', 'reference.page_first',
+    'reference.page_last', 'reference.doi', 'reference.working_paper_institution',
+    'reference.book_title', 'reference.chapter_title',
+]
+
+def process_html_files(html_dir: str, output_file_json: str, output_file_csv: str,
+                       max_workers: Optional[int] = None) -> int:
     """
     Process all HTML files in the specified directory and save metadata to JSON and CSV files.
     
@@ -492,89 +746,91 @@ def process_html_files(html_dir: str, output_file_json: str, output_file_csv: st
         html_dir: Path to directory containing HTML files
         output_file_json: Path to save the output JSON file
         output_file_csv: Path to save the output CSV file
+        max_workers: Number of parsing processes (defaults to the number of CPUs)
     
     Returns:
-        List of dictionaries containing metadata for each article
+        Number of articles processed
     """
-    html_files = list(Path(html_dir).glob('*.html'))
-    all_metadata = []
-    csv_data = []
+    html_files = list(Path(html_dir).glob('*.html')) + list(Path(html_dir).glob('*.html.gz'))
+    processed = 0
     
-    for html_file in html_files:
-        print(f"Processing {html_file}...")
-        try:
-            metadata = parse_wiley_html(str(html_file))
-            
-            # Base article metadata
-            article_metadata = {
-                'article.title': metadata.title,
-                'article.authors': ';'.join(metadata.authors),
-                'article.published_date': metadata.published_date.isoformat() if metadata.published_date else None,
-                'article.volume': metadata.volume,
-                'article.issue': metadata.issue,
-                'article.page_first': metadata.page_first,
-                'article.page_last': metadata.page_last,
-                'article.citations': metadata.citations,
-                'article.doi': metadata.doi,
-            }
-            
-            # Create a row for each reference
-            for ref in metadata.references:
-                ref_dict = {
-                    'reference.ref_type': ref.ref_type.value if ref.ref_type else None,
-                    'reference.authors': ';'.join(ref.authors),
-                    'reference.year': ref.year,
-                    'reference.title': ref.title,
-                    'reference.journal': ref.journal,
-                    'reference.volume': ref.volume,
-                    'reference.page_first': ref.page_first,
-                    'reference.page_last': ref.page_last,
-                    'reference.doi': ref.doi,
-                    'reference.working_paper_institution': ref.working_paper_institution,
-                    'reference.book_title': ref.book_title,
-                    'reference.chapter_title': ref.chapter_title
+    # Rows and articles are written as each article comes in rather than collected for the
+    # whole corpus
+    with open(output_file_csv, 'w', encoding='utf-8', newline='') as csv_file, \
+            open(output_file_json, 'w', encoding='utf-8') as json_file:
+        csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        csv_writer.writeheader()
+        
+        # Files are parsed in worker processes; the rows are built here as each result comes back
+        parsed = iter_parse_wiley_html([str(html_file) for html_file in html_files], max_workers)
+        for html_file, metadata in zip(html_files, parsed):
+            print(f"Processing {html_file}...")
+            try:
+                # Base article metadata
+                article_metadata = {
+                    'article.title': metadata.title,
+                    'article.authors': ';'.join(metadata.authors),
+                    'article.published_date': metadata.published_date.isoformat() if metadata.published_date else None,
+                    'article.volume': metadata.volume,
+                    'article.issue': metadata.issue,
+                    'article.page_first': metadata.page_first,
+                    'article.page_last': metadata.page_last,
+                    'article.citations': metadata.citations,
+                    'article.doi': metadata.doi,
                 }
                 
-                # Combine article metadata with reference data
-                row = {**article_metadata, **ref_dict}
-                csv_data.append(row)
-            
-            # Store complete metadata for JSON
-            metadata_dict = {**article_metadata, 'references': [
-                {
-                    'ref_type': ref.ref_type.value if ref.ref_type else None,
-                    'authors': ref.authors,
-                    'year': ref.year,
-                    'title': ref.title,
-                    'journal': ref.journal,
-                    'volume': ref.volume,
-                    'page_first': ref.page_first,
-                    'page_last': ref.page_last,
-                    'doi': ref.doi,
-                    'working_paper_institution': ref.working_paper_institution,
-                    'book_title': ref.book_title,
-                    'chapter_title': ref.chapter_title
-                } for ref in metadata.references
-            ]}
-            all_metadata.append(metadata_dict)
-            print(f"Successfully processed {metadata_dict['article.title']}")
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
-    
-    # Save JSON
-    with open(output_file_json, 'w', encoding='utf-8') as f:
-        json.dump(all_metadata, f, ensure_ascii=False, indent=2)
-    
-    # Save CSV efficiently using pandas
-    if csv_data:
-        df = pd.DataFrame(csv_data)
-        df.to_csv(output_file_csv, index=False, encoding='utf-8')
+                # Create a row for each reference
+                for ref in metadata.references:
+                    ref_dict = {
+                        'reference.ref_type': ref.ref_type.value if ref.ref_type else None,
+                        'reference.authors': ';'.join(ref.authors),
+                        'reference.year': ref.year,
+                        'reference.title': ref.title,
+                        'reference.journal': ref.journal,
+                        'reference.volume': ref.volume,
+                        'reference.page_first': ref.page_first,
+                        'reference.page_last': ref.page_last,
+                        'reference.doi': ref.doi,
+                        'reference.working_paper_institution': ref.working_paper_institution,
+                        'reference.book_title': ref.book_title,
+                        'reference.chapter_title': ref.chapter_title
+                    }
+                
+                    # Combine article metadata with reference data
+                    row = {**article_metadata, **ref_dict}
+                    csv_writer.writerow(row)
+                
+                # Store complete metadata for JSON
+                metadata_dict = {**article_metadata, 'references': [
+                    {
+                        'ref_type': ref.ref_type.value if ref.ref_type else None,
+                        'authors': ref.authors,
+                        'year': ref.year,
+                        'title': ref.title,
+                        'journal': ref.journal,
+                        'volume': ref.volume,
+                        'page_first': ref.page_first,
+                        'page_last': ref.page_last,
+                        'doi': ref.doi,
+                        'working_paper_institution': ref.working_paper_institution,
+                        'book_title': ref.book_title,
+                        'chapter_title': ref.chapter_title
+                    } for ref in metadata.references
+                ]}
+                write_json_array_item(json_file, metadata_dict, first=processed == 0)
+                processed += 1
+                print(f"Successfully processed {metadata_dict['article.title']}")
+            except Exception as e:
+                print(f"Error processing {html_file}: {e}")
+        
+        # Close the JSON array
+        json_file.write('\n]' if processed else '[]')
     
-    print(f"\nProcessed {len(all_metadata)} articles")
+    print(f"\nProcessed {processed} articles")
     print(f"JSON data saved to {output_file_json}")
     print(f"CSV data saved to {output_file_csv}")
     
-    return all_metadata
+    return processed
 
 def test_single_file(file_path: str) -> None:
     """
@@ -2,25 +2,29 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException, InvalidSessionIdException
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from typing import Tuple, List, Dict, Optional
 import os
+import functools
 import time
 import json
+import gzip
 import random
-import difflib
 import urllib.parse
-import csv
 import requests
-from selenium.webdriver import ActionChains
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml.cssselect import CSSSelector
 import hashlib
 from math import comb
 import traceback
-import pyautogui
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 import pandas as pd
+from chromedriver_utils import chromedriver_path
 
 # List of realistic user agents
 USER_AGENTS = [
@@ -69,6 +73,149 @@ BACKGROUND_SEARCHES = [
     "Kenneth French factor models"
 ]
 
+# Chrome arguments and preferences shared by every driver; only the user agent varies
+CHROME_ARGUMENTS = (
+    # Add common browser extensions to look more legitimate
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--ignore-certificate-errors',
+    '--ignore-ssl-errors',
+    '--start-maximized',
+    # Keep each pooled browser lean: no extensions, background services or extra renderers
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--renderer-process-limit=2',
+)
+CHROME_PREFS = {
+    "profile.default_content_settings.popups": 0,
+    "download.prompt_for_download": False,
+    "download.directory_upgrade": True,
+    "safebrowsing.enabled": True,
+    "profile.cookie_controls_mode": 0,
+    "profile.block_third_party_cookies": False,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+    "profile.default_content_setting_values.cookies": 1
+}
+
+# Selectors for validating pages fetched without a browser, compiled to XPath once
+_SEL_CITATION_DOI = CSSSelector("meta[name='citation_doi']")
+_SEL_WILEY_TITLE = CSSSelector(".citation__title")
+_SEL_JSTOR_TITLE = CSSSelector(".item-title-heading, meta[name='citation_title']")
+
+# Requests the browser never needs to make; stylesheets stay so is_displayed() checks still work
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*"
+]
+
+# Extra words mixed into background searches
+SEARCH_SUFFIX_TERMS = ("review", "survey", "analysis", "study", "research", "paper", "evidence")
+SEARCH_METHOD_TERMS = ("empirical", "theoretical", "quantitative", "qualitative", "experimental")
+
+# Topics for the warm-up searches run before a browser starts on real papers
+FINANCIAL_SEARCH_TERMS = (
+    "stock market volatility",
+    "financial derivatives pricing",
+    "market risk premium",
+    "asset pricing models",
+    "option pricing theory",
+    "financial market efficiency",
+    "portfolio optimization",
+    "risk management finance",
+    "market microstructure",
+    "quantitative trading strategies"
+)
+
+# Headers sent with publisher page requests so they look like they came from Scholar
+SCHOLAR_REFERRAL_HEADERS = {
+    'Referer': 'https://scholar.google.com/',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site',
+    'Sec-Fetch-User': '?1'
+}
+
+# Elements that only appear on Cloudflare challenge pages and Google Scholar's reCAPTCHA page,
+# plus the title Cloudflare shows while its interstitial is still building the challenge
+_CAPTCHA_CHECK_SCRIPT = """
+return document.title.indexOf('Just a moment') !== -1 || document.querySelector(
+    '#cf-browser-verification, #cf-challenge-running, #challenge-form, #cf-please-wait, ' +
+    'input[name="cf_captcha_kind"], #gs_captcha_ccl, iframe[src*="recaptcha"], form[action*="captcha"]'
+) !== null;
+"""
+
+# Which of the given selectors match an element that is rendered on the page (like is_displayed())
+_VISIBLE_SELECTORS_SCRIPT = """
+return arguments[0].filter(function (selector) {
+    var element = document.querySelector(selector);
+    return element !== null && element.getClientRects().length > 0;
+});
+"""
+
+# Page height and viewport height, fetched together for the scrolling helpers
+_PAGE_HEIGHTS_SCRIPT = (
+    "return [Math.max(document.body.scrollHeight, document.documentElement.scrollHeight), window.innerHeight]"
+)
+
+# Simulated mouse movement is slow and only useful against sites that track pointer events
+SIMULATE_MOUSE = os.environ.get('SIMULATE_MOUSE') == '1'
+
+# Human-like pauses and browsing on each paper; page readiness is handled by explicit waits
+ENABLE_HUMAN_DELAYS = os.environ.get('ENABLE_HUMAN_DELAYS') == '1'
+
+# On-disk cache of Scholar searches that already led to a valid publisher page
+RESULT_CACHE_FILE = "scholar_results.cache"
+
+# Directory that saved paper pages are written to
+OUTPUT_DIR = "downloaded_html"
+
+# Save pages as gzip-compressed .html.gz files (level 1: nearly free, still 5-10x smaller)
+COMPRESS_HTML = os.environ.get('COMPRESS_HTML') == '1'
+
+# Number of known-DOI pages fetched in parallel; matches the session's connection pool
+DIRECT_FETCH_WORKERS = 16
+
+# Suffix of the append-only log of per-paper updates kept next to the papers CSV
+PROGRESS_SUFFIX = ".progress.jsonl"
+
+# Seconds between the first Scholar visits of successive pool browsers
+STARTUP_STAGGER = 5
+
+# Papers a browser searches before it repeats the warm-up background searches
+REWARM_EVERY = 20
+
+# Papers in a row a browser may fail to resolve before it is replaced with a fresh one
+MAX_CONSECUTIVE_FAILURES = 5
+
+# Contents of RESULT_CACHE_FILE, loaded on first use by _load_result_cache
+_result_cache: Optional[Dict[str, Dict[str, str]]] = None
+_result_cache_lock = threading.Lock()
+
+# Shared HTTP session for fetching paper pages directly when the DOI is already known
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': random.choice(USER_AGENTS),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+))
+
 def get_random_background_search():
     """Get a random background search with some variations"""
     base_search = random.choice(BACKGROUND_SEARCHES)
@@ -80,13 +227,11 @@ def get_random_background_search():
     
     # Sometimes add specific terms
     if random.random() < 0.2:
-        terms = ["review", "survey", "analysis", "study", "research", "paper", "evidence"]
-        base_search += f" {random.choice(terms)}"
+        base_search += f" {random.choice(SEARCH_SUFFIX_TERMS)}"
     
     # Sometimes add methodology terms
     if random.random() < 0.15:
-        methods = ["empirical", "theoretical", "quantitative", "qualitative", "experimental"]
-        base_search = f"{random.choice(methods)} {base_search}"
+        base_search = f"{random.choice(SEARCH_METHOD_TERMS)} {base_search}"
     
     return base_search
 
@@ -115,12 +260,24 @@ def get_search_link(title: str, doi: str = None, source: str = 'wiley') -> str:
         Direct URL to the paper if possible, None otherwise
     """
     if doi:
+        # Escape characters such as '<' and '#' that appear in older SICI-style DOIs
+        doi = urllib.parse.quote(doi, safe='/:;()')
         if source.lower() == 'wiley':
             return f"https://onlinelibrary.wiley.com/doi/{doi}"
         elif source.lower() == 'jstor':
             return f"https://www.jstor.org/stable/{doi}"
     return None
 
+def scholar_search_url(query: str) -> str:
+    """
+    Build a Google Scholar search URL
+    Args:
+        query: Search query, including any site:/source: operators
+    Returns:
+        Search URL with the query form-encoded
+    """
+    return f"https://scholar.google.com/scholar?{urllib.parse.urlencode({'q': query})}"
+
 def init_driver():
     """Create and configure a Chrome WebDriver instance with enhanced anti-detection measures"""
     options = webdriver.ChromeOptions()
@@ -129,35 +286,17 @@ def init_driver():
     user_agent = random.choice(USER_AGENTS)
     options.add_argument(f'user-agent={user_agent}')
     
-    # Add common browser extensions to look more legitimate
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    
-    # Add common browser preferences
-    options.add_experimental_option("prefs", {
-        "profile.default_content_settings.popups": 0,
-        "download.prompt_for_download": False,
-        "download.directory_upgrade": True,
-        "safebrowsing.enabled": True,
-        "profile.cookie_controls_mode": 0,
-        "profile.block_third_party_cookies": False,
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "profile.default_content_setting_values.notifications": 2,
-        "profile.managed_default_content_settings.images": 1,
-        "profile.default_content_setting_values.cookies": 1
-    })
-    
-    # Add common Chrome arguments
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--disable-software-rasterizer')
-    options.add_argument('--ignore-certificate-errors')
-    options.add_argument('--ignore-ssl-errors')
-    options.add_argument('--start-maximized')
+    # Add common Chrome arguments and browser preferences
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", CHROME_PREFS)
     
     # Create WebDriver with enhanced options
-    driver = webdriver.Chrome(options=options)
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    
+    # Skip fonts, media and trackers; only the HTML and the elements we validate are needed
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
     
     # Add additional JavaScript patches to avoid detection
     driver.execute_cdp_cmd('Network.setUserAgentOverride', {
@@ -188,12 +327,31 @@ def init_driver():
     
     return driver
 
+def wait_for_navigation(driver, old_url: str, timeout: int = 20) -> bool:
+    """
+    Wait until the browser has left old_url and the new document has been parsed
+    Args:
+        driver: Selenium WebDriver instance
+        old_url: URL of the page the navigation started from
+        timeout: Maximum number of seconds to wait
+    Returns:
+        True if the new page is ready, False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.current_url != old_url
+            and d.execute_script("return document.readyState") != "loading"
+        )
+        return True
+    except TimeoutException:
+        print(f"Page did not finish loading within {timeout} seconds")
+        return False
+
 def add_random_scroll(driver, target_element=None):
     """Simulate natural scrolling behavior"""
     try:
-        # Get page height
-        page_height = driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-        viewport_height = driver.execute_script("return window.innerHeight")
+        # Get page and viewport height in one round-trip
+        page_height, viewport_height = driver.execute_script(_PAGE_HEIGHTS_SCRIPT)
         current_position = 0
         
         # Number of scroll steps (more steps = smoother scrolling)
@@ -239,28 +397,26 @@ def add_random_scroll(driver, target_element=None):
         print(f"Error during scrolling: {str(e)}")
 
 def move_to_element_realistic(driver, element):
-    """Move to element with realistic mouse movement"""
+    """
+    Move to element with realistic mouse movement.
+    Movement is only simulated when SIMULATE_MOUSE is set; otherwise the element is just
+    scrolled into view.
+    Returns:
+        True if the element is in view and ready to be clicked, False otherwise
+    """
     try:
-        # Get element location and size
+        # Get element location and size (viewport coordinates, after scrolling it into view)
         location = element.location_once_scrolled_into_view
+        if not SIMULATE_MOUSE:
+            return True
         size = element.size
         
         # Calculate a random point within the element
         x = location['x'] + size['width'] * random.uniform(0.2, 0.8)
         y = location['y'] + size['height'] * random.uniform(0.2, 0.8)
         
-        # Add offset for window position and scrolling
-        window_x = driver.execute_script('return window.screenX')
-        window_y = driver.execute_script('return window.screenY')
-        scroll_y = driver.execute_script('return window.pageYOffset')
-        
-        # Calculate final coordinates
-        # Add window offset and account for Chrome's header bar (~80px)
-        final_x = x + window_x
-        final_y = y + window_y + 80
-        
         # Move mouse with natural motion
-        smooth_move_mouse(final_x, final_y, duration=random.uniform(0.5, 1.0))
+        smooth_move_mouse(driver, x, y, duration=random.uniform(0.5, 1.0))
         
         # Small pause after reaching the element
         random_delay(0.1, 0.3)
@@ -270,10 +426,13 @@ def move_to_element_realistic(driver, element):
         print(f"Error moving mouse: {str(e)}")
         return False
 
-def smooth_move_mouse(x, y, duration=1):
-    """Move mouse in a human-like curved motion"""
-    # Get current position
-    start_x, start_y = pyautogui.position()
+def smooth_move_mouse(driver, x, y, duration=1):
+    """
+    Move the page's mouse pointer in a human-like curved motion.
+    Events are sent to the browser over CDP, so parallel drivers never share the OS cursor.
+    """
+    # Start from where this driver's pointer was left
+    start_x, start_y = getattr(driver, 'mouse_position', (0, 0))
     
     # Generate a smooth curve between points
     # Number of intermediate points
@@ -285,38 +444,37 @@ def smooth_move_mouse(x, y, duration=1):
     control_x2 = start_x + (x - start_x) * random.uniform(0.6, 0.8)
     control_y2 = start_y + (y - start_y) * random.uniform(0.6, 0.8)
     
-    def bezier(t):
-        # Cubic Bezier curve
-        return (
-            (1-t)**3 * start_x + 3*(1-t)**2 * t * control_x1 + 
-            3*(1-t) * t**2 * control_x2 + t**3 * x,
-            (1-t)**3 * start_y + 3*(1-t)**2 * t * control_y1 + 
-            3*(1-t) * t**2 * control_y2 + t**3 * y
-        )
+    # Evaluate the whole cubic Bezier curve at once with the Bernstein basis
+    ctrl = np.array([[start_x, start_y], [control_x1, control_y1], [control_x2, control_y2], [x, y]])
+    degree = len(ctrl) - 1
+    k = np.arange(degree + 1)
+    t = (np.arange(steps) / steps)[:, None]
+    basis = np.array([comb(degree, i) for i in k]) * t**k * (1 - t)**(degree - k)
+    
+    # Add slight random variation to every point
+    points = basis @ ctrl + np.random.normal(0, 2, (steps, 2))
+    
+    # Time for each step with slight random variation
+    step_durations = duration / steps * np.random.uniform(0.8, 1.2, steps)
     
     # Move mouse along curve
-    for i in range(steps):
-        t = i / steps
-        next_x, next_y = bezier(t)
-        
-        # Add slight random variation
-        next_x += random.gauss(0, 2)
-        next_y += random.gauss(0, 2)
-        
-        # Calculate time for this step with slight random variation
-        step_duration = duration / steps * random.uniform(0.8, 1.2)
-        
-        pyautogui.moveTo(next_x, next_y, step_duration)
+    for (next_x, next_y), step_duration in zip(points.tolist(), step_durations.tolist()):
+        dispatch_mouse_move(driver, next_x, next_y)
+        time.sleep(step_duration)
     
     # Final move to exact destination
-    pyautogui.moveTo(x, y, duration/steps)
+    dispatch_mouse_move(driver, x, y)
+    driver.mouse_position = (x, y)
+
+def dispatch_mouse_move(driver, x, y):
+    """Send a single mouse-move event at viewport coordinates (x, y) to the page"""
+    driver.execute_cdp_cmd('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': max(0, x), 'y': max(0, y)})
 
 def add_natural_page_interaction(driver):
     """Add natural mouse movements and scrolling to make the browsing look more human-like"""
     try:
-        # Get page height
-        height = driver.execute_script("return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)")
-        viewport_height = driver.execute_script("return window.innerHeight")
+        # Get page and viewport height in one round-trip
+        height, viewport_height = driver.execute_script(_PAGE_HEIGHTS_SCRIPT)
         
         # Find some interactive elements to hover over
         interactive_elements = driver.find_elements(By.CSS_SELECTOR, 
@@ -385,33 +543,30 @@ def add_natural_page_interaction(driver):
 def try_source(driver, source_site: str, title: str, journal: str = None) -> Tuple[str, str]:
     try:
         # Set referrer policy to look more legitimate
-        driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
-            'headers': {
-                'Referer': 'https://scholar.google.com/',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'DNT': '1',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'cross-site',
-                'Sec-Fetch-User': '?1'
-            }
-        })
+        driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {'headers': SCHOLAR_REFERRAL_HEADERS})
+        
+        # Go straight to the publisher page if an earlier run already resolved this search
+        cache_key = result_cache_key(title, source_site, journal)
+        cached = get_cached_result(cache_key)
+        if cached:
+            print(f"\nUsing cached result page: {cached['url']}")
+            driver.get(cached['url'])
+            doi, html_file = extract_from_publisher_page(driver, source_site, title)
+            if doi:
+                return doi, html_file
+            print("Cached result page is no longer valid, searching again")
         
         # Now do our actual search with site restriction
         search_query = f'"{title}" site:{source_site}'
         if journal:
             search_query += f' source:"{journal}"'
         
-        encoded_query = urllib.parse.quote(search_query)
-        url = f"https://scholar.google.com/scholar?q={encoded_query}"
+        url = scholar_search_url(search_query)
         print(f"\nSearching Google Scholar for: {search_query}")
         
         # Load main search
         print("Loading search results...")
         driver.get(url)
-        random_delay(2, 3)  # Longer wait for main search
         
         # Check for captcha on main search
         if is_cloudflare_captcha(driver):
@@ -422,7 +577,7 @@ def try_source(driver, source_site: str, title: str, journal: str = None) -> Tup
         timeout = 5 if source_site == 'wiley.com' else 10
         try:
             print("Looking for search result link...")
-            link = WebDriverWait(driver, timeout).until(
+            link = WebDriverWait(driver, timeout, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".gs_rt a"))
             )
             
@@ -430,54 +585,115 @@ def try_source(driver, source_site: str, title: str, journal: str = None) -> Tup
             print("Moving to and clicking link...")
             
             # More natural mouse movement and clicking
+            search_url = driver.current_url
             if move_to_element_realistic(driver, link):
-                random_delay(1, 1.5)  # Pause before clicking
+                if ENABLE_HUMAN_DELAYS:
+                    random_delay(1, 1.5)  # Pause before clicking
                 link.click()
             else:
                 # Fallback to JavaScript click if mouse movement fails
                 driver.execute_script("arguments[0].click();", link)
             
-            random_delay(3, 4)  # Longer wait after clicking
+            # Wait for the publisher page instead of a fixed pause after clicking
+            wait_for_navigation(driver, search_url)
             
             # Add natural browsing behavior on publisher page
-            add_natural_page_interaction(driver)
+            if ENABLE_HUMAN_DELAYS:
+                add_natural_page_interaction(driver)
             
-            # Validate page and handle accordingly
-            if source_site == 'wiley.com':
-                if is_valid_wiley_page(driver):
-                    print("Valid Wiley page found, extracting DOI...")
-                    # Save content and extract DOI
-                    html_file = save_page_content(driver, title)
-                    try:
-                        doi_meta = driver.find_element(By.CSS_SELECTOR, "meta[name='citation_doi']")
-                        doi = doi_meta.get_attribute("content")
-                        if doi:
-                            return doi, html_file
-                    except:
-                        print("Could not extract DOI from Wiley page")
-                else:
-                    print("Invalid Wiley page")
-            else:  # JSTOR
-                if is_valid_jstor_page(driver):
-                    print("Valid JSTOR page found, extracting DOI...")
-                    # Save content and extract DOI
-                    html_file = save_page_content(driver, title)
-                    doi = extract_doi_from_jstor(driver)
-                    if doi:
-                        return doi, html_file
-                    print("Could not extract DOI from JSTOR page")
-                else:
-                    print("Invalid JSTOR page")
+            # Validate page, save it and remember where the search led
+            doi, html_file = extract_from_publisher_page(driver, source_site, title)
+            if doi:
+                cache_result(cache_key, driver.current_url, doi)
+                return doi, html_file
             
         except TimeoutException:
             print(f"No results found on {source_site}")
             
+    except InvalidSessionIdException:
+        # The browser is gone; let the caller replace it instead of marking the paper as missing
+        raise
     except Exception as e:
         print(f"Error searching {source_site}: {str(e)}")
         traceback.print_exc()
     
     return None, None
 
+def extract_from_publisher_page(driver, source_site: str, title: str) -> Tuple[str, str]:
+    """
+    Validate the publisher page the driver is on, save it and extract the DOI
+    Args:
+        driver: Selenium WebDriver instance
+        source_site: Site the page should belong to ('wiley.com' or 'jstor.org')
+        title: Paper title (used for filename)
+    Returns:
+        (doi, html_file), or (None, None) if the page is not a valid paper page
+    """
+    if source_site == 'wiley.com':
+        if is_valid_wiley_page(driver):
+            print("Valid Wiley page found, extracting DOI...")
+            # Fetch the page HTML once; it is both saved and searched for the DOI
+            html_content = driver.page_source
+            html_file = save_page_content(driver, title, html_content)
+            doi = citation_doi_from_html(html_content)
+            if doi:
+                return doi, html_file
+            print("Could not extract DOI from Wiley page")
+        else:
+            print("Invalid Wiley page")
+    else:  # JSTOR
+        if is_valid_jstor_page(driver):
+            print("Valid JSTOR page found, extracting DOI...")
+            # Fetch the page HTML once; it is both saved and searched for the DOI
+            html_content = driver.page_source
+            html_file = save_page_content(driver, title, html_content)
+            doi = citation_doi_from_html(html_content) or extract_doi_from_jstor(driver)
+            if doi:
+                return doi, html_file
+            print("Could not extract DOI from JSTOR page")
+        else:
+            print("Invalid JSTOR page")
+    
+    return None, None
+
+def result_cache_key(title: str, source_site: str, journal: str = None) -> str:
+    """Key for a Scholar search in the result cache"""
+    return hashlib.sha1(f"{title}|{source_site}|{journal}".encode('utf-8')).hexdigest()
+
+def _load_result_cache() -> Dict[str, Dict[str, str]]:
+    """Load the result cache from disk on first use; callers must hold _result_cache_lock"""
+    global _result_cache
+    if _result_cache is None:
+        try:
+            with open(RESULT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _result_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _result_cache = {}
+    return _result_cache
+
+def get_cached_result(key: str) -> Optional[Dict[str, str]]:
+    """
+    Look up a previously resolved Scholar search
+    Args:
+        key: Key from result_cache_key
+    Returns:
+        Dict with the publisher page 'url' and 'doi', or None if the search was never resolved
+    """
+    with _result_cache_lock:
+        return _load_result_cache().get(key)
+
+def cache_result(key: str, url: str, doi: str):
+    """Remember the publisher page and DOI a Scholar search resolved to"""
+    with _result_cache_lock:
+        cache = _load_result_cache()
+        cache[key] = {'url': url, 'doi': doi}
+        
+        # Write to a temporary file and swap it in so a crash never leaves a half-written cache
+        tmp_file = RESULT_CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, RESULT_CACHE_FILE)
+
 def get_random_financial_searches(num_searches: int = 2) -> List[str]:
     """
     Generate random financial search terms
@@ -486,150 +702,346 @@ def get_random_financial_searches(num_searches: int = 2) -> List[str]:
     Returns:
         List of search terms
     """
-    terms = [
-        "stock market volatility",
-        "financial derivatives pricing",
-        "market risk premium",
-        "asset pricing models",
-        "option pricing theory",
-        "financial market efficiency",
-        "portfolio optimization",
-        "risk management finance",
-        "market microstructure",
-        "quantitative trading strategies"
-    ]
-    return random.sample(terms, min(len(terms), num_searches))
-
-def process_papers_from_csv(csv_path: str = "data/JF.csv", journal: str = "the journal of finance"):
+    return random.sample(FINANCIAL_SEARCH_TERMS, min(len(FINANCIAL_SEARCH_TERMS), num_searches))
+
+def warm_up_driver(driver) -> bool:
+    """
+    Warm up a browser with a visit to Google Scholar and a few background searches
+    Args:
+        driver: Selenium WebDriver instance
+    Returns:
+        False if a captcha was hit during warmup, True otherwise
+    """
+    print("\nWarming up browser...")
+    driver.get("https://scholar.google.com")
+    random_delay(2, 3)
+    
+    # Do 2-3 background searches
+    num_searches = random.randint(2, 3)
+    searches = get_random_financial_searches(num_searches)
+    
+    for search in searches:
+        print(f"\nDoing background search: {search}")
+        driver.get(scholar_search_url(search))
+        random_delay(1, 2)
+        
+        # Check for captcha
+        if is_cloudflare_captcha(driver):
+            print("Hit Cloudflare captcha during warmup")
+            return False
+        
+        # Add natural scrolling and hovering
+        add_random_scroll(driver)
+        random_delay(1, 1.5)
+        
+        # Try to click a random result
+        citations = driver.find_elements(By.CSS_SELECTOR, ".gs_r, .gs_rt a")
+        if citations:
+            citation = random.choice(citations)
+            try:
+                if move_to_element_realistic(driver, citation):
+                    random_delay(1, 1.5)
+            except:
+                pass
+    
+    return True
+
+# Each pool thread owns one persistent browser; all of them are tracked so they can be closed.
+# A driver is only ever driven from the thread that created it, so the single keep-alive
+# connection Selenium opens to its chromedriver is never contended.
+_thread_state = threading.local()
+_thread_drivers = []
+_thread_drivers_lock = threading.Lock()
+
+def _get_thread_driver():
+    """
+    Get the current thread's WebDriver, creating and warming it up on first use.
+    The browser is warmed up again every REWARM_EVERY papers and after it is replaced.
+    Returns:
+        Selenium WebDriver instance, or None if warmup hit a captcha
+    """
+    driver = getattr(_thread_state, 'driver', None)
+    if driver is None:
+        driver = init_driver()
+        with _thread_drivers_lock:
+            slot = len(_thread_drivers)
+            _thread_drivers.append(driver)
+        _thread_state.driver = driver
+        
+        # Stagger the first Scholar visits so the pool does not hit it all at once
+        time.sleep(slot * STARTUP_STAGGER)
+        _thread_state.warm = warm_up_driver(driver)
+        _thread_state.papers_since_warm = 0
+    elif _thread_state.warm and _thread_state.papers_since_warm >= REWARM_EVERY:
+        _thread_state.warm = warm_up_driver(driver)
+        _thread_state.papers_since_warm = 0
+    _thread_state.papers_since_warm += 1
+    return driver if _thread_state.warm else None
+
+def _restart_thread_driver():
+    """Replace the current thread's WebDriver after its session was lost or it kept failing"""
+    old_driver = _thread_state.driver
+    new_driver = restart_driver(old_driver)
+    with _thread_drivers_lock:
+        _thread_drivers[_thread_drivers.index(old_driver)] = new_driver
+    _thread_state.driver = new_driver
+    _thread_state.failures = 0
+    # Warm the new browser up before its next paper
+    _thread_state.papers_since_warm = REWARM_EVERY
+
+def _quit_thread_drivers():
+    """Quit every WebDriver created by the pool threads"""
+    with _thread_drivers_lock:
+        for driver in _thread_drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        _thread_drivers.clear()
+
+def _process_paper(title: str, journal: str, stop_event: threading.Event) -> Tuple[str, str]:
+    """
+    Look up one paper on Google Scholar with the calling thread's browser
+    Args:
+        title: Paper title
+        journal: Journal name for search filtering
+        stop_event: Set once any worker hits a captcha
+    Returns:
+        (doi, html_file) as returned by get_doi_from_google_scholar, ("CAPTCHA", None) if a
+        captcha was hit, or ("SKIPPED", None) if the paper was not attempted
+    """
+    if stop_event.is_set():
+        return "SKIPPED", None
+    
+    driver = _get_thread_driver()
+    if driver is None:
+        return "CAPTCHA", None
+    
+    try:
+        result = get_doi_from_google_scholar(driver, title, journal)
+    except InvalidSessionIdException:
+        # Keep the same browser for the whole run; only replace it once its session is lost
+        print("Browser session lost - starting a new driver, paper left for the next run")
+        _restart_thread_driver()
+        return "SKIPPED", None
+    
+    # The browser stays up across papers; only a run of misses suggests it is stuck or soft-blocked
+    if result[0] is None:
+        _thread_state.failures = getattr(_thread_state, 'failures', 0) + 1
+        if _thread_state.failures >= MAX_CONSECUTIVE_FAILURES:
+            print(f"{_thread_state.failures} papers in a row not found - starting a new driver")
+            _restart_thread_driver()
+    else:
+        _thread_state.failures = 0
+    
+    # Random delay between papers
+    random_delay(2, 4)
+    return result
+
+def progress_path(csv_path: str) -> str:
+    """Path of the progress log for a papers CSV, e.g. data/JF.progress.jsonl for data/JF.csv"""
+    return os.path.splitext(csv_path)[0] + PROGRESS_SUFFIX
+
+def replay_progress(df: pd.DataFrame, path: str) -> int:
+    """
+    Apply updates logged by an interrupted run to the papers dataframe
+    Args:
+        df: Papers dataframe read from the CSV
+        path: Progress log from progress_path
+    Returns:
+        Number of logged updates applied
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return 0
+    
+    rows_by_title = {title: idx for idx, title in df['Title'].items()}
+    applied = 0
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # The last line may be cut short if the run was killed mid-write
+            continue
+        idx = rows_by_title.get(entry['title'])
+        if idx is None:
+            continue
+        df.at[idx, 'HTML'] = entry['html']
+        df.at[idx, 'DOI'] = entry['doi']
+        df.at[idx, 'Source'] = entry['source']
+        applied += 1
+    return applied
+
+def log_progress(progress_file, title: str, html_file: str, doi: str, source: str):
+    """Append one paper's update to the progress log and flush it to disk"""
+    progress_file.write(json.dumps({'title': title, 'html': html_file, 'doi': doi, 'source': source}) + '\n')
+    progress_file.flush()
+
+def save_papers_csv(df: pd.DataFrame, csv_path: str):
+    """Serialize the papers dataframe in memory, then swap it in so the CSV is never left half-written"""
+    csv_content = df.to_csv(index=False, header=False)
+    tmp_path = csv_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(csv_content)
+    os.replace(tmp_path, csv_path)
+
+def process_papers_from_csv(csv_path: str = "data/JF.csv", journal: str = "the journal of finance", num_workers: int = 4):
     """
     Process papers from a CSV file, downloading HTML content for each paper.
     Args:
         csv_path: Path to CSV file containing paper titles
         journal: Journal name for search filtering
+        num_workers: Number of Chrome instances searching in parallel
+    Each update is appended to a progress log as it happens and the CSV is rewritten once at the
+    end; the log of an interrupted run is replayed on the next start.
     """
     # Read CSV file
     df = pd.read_csv(csv_path, header=None, names=['Title', 'HTML', 'DOI', 'Source'])
     
-    # Initialize driver
-    driver = init_driver()
+    progress_log = progress_path(csv_path)
+    replayed = replay_progress(df, progress_log)
+    if replayed:
+        print(f"Recovered {replayed} updates from an interrupted run")
+    progress_file = open(progress_log, 'a', encoding='utf-8')
+    
+    stop_event = threading.Event()
     
     try:
-        # Warm up the browser first
-        print("\nWarming up browser...")
-        driver.get("https://scholar.google.com")
-        random_delay(2, 3)
-        
-        # Do 2-3 background searches
-        num_searches = random.randint(2, 3)
-        searches = get_random_financial_searches(num_searches)
-        
-        for search in searches:
-            print(f"\nDoing background search: {search}")
-            driver.get(f"https://scholar.google.com/scholar?q={urllib.parse.quote(search)}")
-            random_delay(1, 2)
-            
-            # Check for captcha
-            if is_cloudflare_captcha(driver):
-                print("Hit Cloudflare captcha during warmup")
-                driver.quit()
-                return
-            
-            # Add natural scrolling and hovering
-            add_random_scroll(driver)
-            random_delay(1, 1.5)
-            
-            # Try to click a random result
-            citations = driver.find_elements(By.CSS_SELECTOR, ".gs_r, .gs_rt a")
-            if citations:
-                citation = random.choice(citations)
-                try:
-                    if move_to_element_realistic(driver, citation):
-                        random_delay(1, 1.5)
-                except:
-                    pass
-        
-        # Process each paper
-        papers_processed = 0
+        # Papers that already have a DOI only need their page, which can be fetched without a browser
+        direct = []
         for idx, row in df.iterrows():
-            title = row['Title']
-            html = row['HTML']
             doi = row['DOI']
-            source = row['Source']
-            
-            # Skip if we already have this paper
-            if pd.notna(html) and pd.notna(doi) and pd.notna(source):
-                print(f"\nSkipping already processed paper: {title}")
+            if pd.notna(row['HTML']) or pd.isna(doi) or doi == 'NA':
                 continue
+            source = row['Source'] if pd.notna(row['Source']) else source_from_doi(doi)
+            direct.append((idx, row['Title'], doi, source))
+        
+        # These fetches are plain HTTP, so run many at once over the shared session
+        if direct:
+            with ThreadPoolExecutor(max_workers=DIRECT_FETCH_WORKERS) as executor:
+                futures = {executor.submit(fetch_page_direct, title, doi, source): (idx, source)
+                           for idx, title, doi, source in direct}
+                for future in as_completed(futures):
+                    idx, source = futures[future]
+                    html_file = future.result()
+                    if html_file:
+                        df.at[idx, 'HTML'] = html_file
+                        df.at[idx, 'Source'] = source
+                        log_progress(progress_file, df.at[idx, 'Title'], html_file, df.at[idx, 'DOI'], source)
+        
+        # Skip papers we already have
+        pending = [(idx, row['Title']) for idx, row in df.iterrows()
+                   if not (pd.notna(row['HTML']) and pd.notna(row['DOI']) and pd.notna(row['Source']))]
+        print(f"\n{len(df) - len(pending)} papers already processed, {len(pending)} remaining")
+        if not pending:
+            return
+        
+        # Workers share the paper list; only this thread touches the dataframe and the CSV
+        papers_processed = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(num_workers, len(pending)))) as executor:
+            futures = {executor.submit(_process_paper, title, journal, stop_event): (idx, title)
+                       for idx, title in pending}
             
-            print(f"\nProcessing paper {papers_processed + 1}: {title}")
-            
-            # Try to get DOI from Google Scholar
             try:
-                new_doi, html_file = get_doi_from_google_scholar(driver, title, journal)
-                
-                if new_doi == "CAPTCHA":
-                    print("Hit CAPTCHA - stopping for now")
-                    break
-                
-                if new_doi:
-                    # Update dataframe with new information
-                    df.at[idx, 'DOI'] = new_doi
-                    df.at[idx, 'HTML'] = html_file
-                    df.at[idx, 'Source'] = 'wiley' if 'wiley' in new_doi else 'jstor'
+                for future in as_completed(futures):
+                    idx, title = futures[future]
+                    try:
+                        new_doi, html_file = future.result()
+                    except Exception as e:
+                        print(f"Error processing paper: {str(e)}")
+                        traceback.print_exc()
+                        continue
                     
-                    # Save progress after each successful paper
-                    df.to_csv(csv_path, index=False, header=False)
-                    print(f"Saved paper info: DOI={new_doi}")
-                    papers_processed += 1
+                    if new_doi == "SKIPPED":
+                        continue
                     
-                else:
-                    print(f"Paper not found - marking as NA: {title}")
-                    df.at[idx, 'DOI'] = 'NA'
-                    df.at[idx, 'HTML'] = 'NA'
-                    df.at[idx, 'Source'] = 'NA'
-                    df.to_csv(csv_path, index=False, header=False)
-                
-                # Random delay between papers
-                random_delay(2, 4)
-                
-            except Exception as e:
-                print(f"Error processing paper: {str(e)}")
-                traceback.print_exc()
-                continue
+                    if new_doi == "CAPTCHA":
+                        if not stop_event.is_set():
+                            print("Hit CAPTCHA - stopping for now")
+                            stop_event.set()
+                        continue
+                    
+                    if new_doi:
+                        # Update dataframe with new information
+                        df.at[idx, 'DOI'] = new_doi
+                        df.at[idx, 'HTML'] = html_file
+                        df.at[idx, 'Source'] = 'wiley' if 'wiley' in new_doi else 'jstor'
+                        
+                        papers_processed += 1
+                        print(f"Found paper info ({papers_processed} so far): DOI={new_doi}")
+                        
+                    else:
+                        print(f"Paper not found - marking as NA: {title}")
+                        df.at[idx, 'DOI'] = 'NA'
+                        df.at[idx, 'HTML'] = 'NA'
+                        df.at[idx, 'Source'] = 'NA'
+                    
+                    # Log the update instead of rewriting the whole CSV
+                    log_progress(progress_file, title, df.at[idx, 'HTML'], df.at[idx, 'DOI'], df.at[idx, 'Source'])
+            finally:
+                # Let queued papers return immediately if we stop early
+                stop_event.set()
             
     except Exception as e:
         print(f"Fatal error: {str(e)}")
         traceback.print_exc()
     
     finally:
-        # Save final state
-        df.to_csv(csv_path, index=False, header=False)
+        _quit_thread_drivers()
+        
+        # Save final state; the progress log is only dropped once the CSV holds everything in it
+        progress_file.close()
+        save_papers_csv(df, csv_path)
+        os.remove(progress_log)
+
+def restart_driver(driver):
+    """
+    Replace a WebDriver whose browser session has been lost
+    Args:
+        driver: Selenium WebDriver instance to discard
+    Returns:
+        New Selenium WebDriver instance
+    """
+    try:
         driver.quit()
+    except WebDriverException:
+        pass
+    return init_driver()
 
 def is_cloudflare_captcha(driver) -> bool:
     """
-    Check if we're on a Cloudflare captcha page
+    Check if we're on a Cloudflare (or Google Scholar reCAPTCHA) challenge page
     Args:
         driver: Selenium WebDriver instance
     Returns:
         True if on captcha page, False otherwise
     """
     try:
-        # Look for common Cloudflare elements
-        cloudflare_elements = [
-            "cf-browser-verification",  # div id
-            "cf-challenge-running",     # div id
-            "cf_captcha_kind",         # input name
-            "challenge-form",          # form id
-            "cf-please-wait"          # text content
-        ]
-        
-        # Check page source for any of these elements
-        page_source = driver.page_source.lower()
-        return any(element.lower() in page_source for element in cloudflare_elements)
+        # One DOM query in the browser instead of pulling the whole page source into Python
+        return bool(driver.execute_script(_CAPTCHA_CHECK_SCRIPT))
     except:
         return False
 
+def find_visible_selectors(driver, selectors: List[str], timeout: float) -> List[str]:
+    """
+    Wait for any of the selectors to appear, then check all of them in one script call
+    Args:
+        driver: Selenium WebDriver instance
+        selectors: CSS selectors to look for
+        timeout: Seconds to wait for the first of them to appear
+    Returns:
+        The selectors whose first match is displayed, in the order given
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(selectors)))
+        )
+    except TimeoutException:
+        return []
+    return driver.execute_script(_VISIBLE_SELECTORS_SCRIPT, selectors)
+
 def is_valid_wiley_page(driver) -> bool:
     """
     Check if we're on a valid Wiley paper page
@@ -663,16 +1075,7 @@ def is_valid_wiley_page(driver) -> bool:
             ".citation__title"
         ]
         
-        found_elements = []
-        for selector in selectors:
-            try:
-                element = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                if element.is_displayed():
-                    found_elements.append(selector)
-            except:
-                continue
+        found_elements = find_visible_selectors(driver, selectors, timeout=5)
                 
         # We need at least 3 elements to consider it a valid page
         is_valid = len(found_elements) >= 3
@@ -722,16 +1125,7 @@ def is_valid_jstor_page(driver) -> bool:
             ".header-metadata__urls"
         ]
         
-        found_elements = []
-        for selector in essential_selectors:
-            try:
-                element = WebDriverWait(driver, 2).until(  # Short timeout
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                if element.is_displayed():
-                    found_elements.append(selector)
-            except:
-                continue
+        found_elements = find_visible_selectors(driver, essential_selectors, timeout=2)
         
         # Need at least 4 of the 6 essential elements to consider it valid
         is_valid = len(found_elements) >= 4
@@ -809,33 +1203,123 @@ def get_doi_from_google_scholar(driver, title: str, journal: str = None) -> Tupl
     # If we get here, neither source worked
     return None, None
 
-def save_page_content(driver, title: str) -> str:
+def save_page_content(driver, title: str, html_content: str = None) -> str:
     """
     Save the HTML content of a page using Selenium's page source.
     Args:
         driver: Selenium WebDriver instance
         title: Paper title (used for filename)
+        html_content: Page source the caller already fetched, to avoid serializing the DOM again
     Returns:
         Path to saved HTML file
     """
     try:
-        # Create output directory if it doesn't exist
-        output_dir = "downloaded_html"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        # Create SHA-256 hash of the original title
-        title_hash = hashlib.sha256(title.encode('utf-8')).hexdigest()
-        filename = os.path.join(output_dir, f"{title_hash}.html")
-        
-        # Get the page source and save it
-        html_content = driver.page_source
+        if html_content is None:
+            html_content = driver.page_source
+        return write_page_html(title, html_content)
+    except Exception as e:
+        print(f"Error saving page: {str(e)}")
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _output_dir() -> str:
+    """Create the HTML output directory on first use instead of checking it on every save"""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return OUTPUT_DIR
+
+def write_page_html(title: str, html_content: str) -> str:
+    """
+    Write page HTML to the downloaded_html directory, gzip-compressed if COMPRESS_HTML is set.
+    Args:
+        title: Paper title (used for filename)
+        html_content: HTML of the paper page
+    Returns:
+        Path to saved HTML file
+    """
+    # Create SHA-256 hash of the original title
+    title_hash = hashlib.sha256(title.encode('utf-8')).hexdigest()
+    filename = os.path.join(_output_dir(), f"{title_hash}.html")
+    
+    if COMPRESS_HTML:
+        filename += '.gz'
+        with gzip.open(filename, 'wt', encoding='utf-8', compresslevel=1) as f:
+            f.write(html_content)
+    else:
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(html_content)
-            
-        print(f"Saved page content to: {filename}")
-        return filename
         
+    print(f"Saved page content to: {filename}")
+    return filename
+
+def source_from_doi(doi: str) -> str:
+    """
+    Guess the source platform of a paper from its DOI
+    Args:
+        doi: Paper DOI
+    Returns:
+        'jstor' for JSTOR DOIs, 'wiley' otherwise
+    """
+    return 'jstor' if doi.startswith('10.2307/') else 'wiley'
+
+def citation_doi_from_html(html_content: str) -> Optional[str]:
+    """
+    Read the DOI from the citation_doi meta tag of a saved page
+    Args:
+        html_content: HTML of the paper page
+    Returns:
+        DOI string if the tag is present, None otherwise
+    """
+    try:
+        doi_meta = _SEL_CITATION_DOI(lxml.html.fromstring(html_content))
+    except Exception:
+        return None
+    return doi_meta[0].get('content') if doi_meta else None
+
+def is_valid_paper_html(html_content: str, source: str) -> bool:
+    """
+    Check that HTML fetched without a browser is a real paper page rather than
+    a challenge, login or error page
+    Args:
+        html_content: HTML of the fetched page
+        source: Source platform ('wiley' or 'jstor')
+    Returns:
+        True if the page looks like a paper page, False otherwise
+    """
+    try:
+        tree = lxml.html.fromstring(html_content)
+    except Exception:
+        return False
+    if source.lower() == 'wiley':
+        return bool(_SEL_CITATION_DOI(tree)) and bool(_SEL_WILEY_TITLE(tree))
+    return bool(_SEL_JSTOR_TITLE(tree))
+
+def fetch_page_direct(title: str, doi: str, source: str) -> Optional[str]:
+    """
+    Download a paper page over HTTPS for a known DOI, skipping Selenium and Google Scholar.
+    Args:
+        title: Paper title (used for filename)
+        doi: Paper DOI
+        source: Source platform ('wiley' or 'jstor')
+    Returns:
+        Path to saved HTML file, or None if the page could not be fetched directly
+    """
+    url = get_search_link(title, doi, source)
+    if not url:
+        return None
+    
+    try:
+        response = _SESSION.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Direct fetch failed for {url}: {str(e)}")
+        return None
+    
+    if not is_valid_paper_html(response.text, source):
+        print(f"Direct fetch of {url} did not return a paper page")
+        return None
+    
+    try:
+        return write_page_html(title, response.text)
     except Exception as e:
         print(f"Error saving page: {str(e)}")
         return None